@@ -53,6 +53,13 @@ class Settings(BaseSettings):
     # Generate with: python -c "from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())"
     CARD_ENCRYPTION_KEY: str
 
+    # --- Statements ---
+    # Closed-month statements kept in memory (per process); 0 disables the cache
+    STATEMENT_CACHE_SIZE: int = 1024
+    # Seconds after a month ends before its statement may be cached, so
+    # transactions in flight at the boundary (in any process) land first
+    STATEMENT_CACHE_GRACE_SECONDS: int = 3600
+
     # --- CORS ---
     # Origins allowed to make cross-origin requests (frontend URLs)
     ALLOWED_ORIGINS: list[str] = ["http://localhost:3000"]
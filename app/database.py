@@ -13,6 +13,14 @@ Architecture note:
   concurrent requests without blocking. When migrating to PostgreSQL, only
   the DATABASE_URL needs to change (to use asyncpg driver).
 
+Statement caching:
+  SQLAlchemy caches the compiled SQL of every statement on the engine,
+  keyed by statement structure (query_cache_size, LRU). On PostgreSQL the
+  asyncpg driver can additionally keep server-side prepared statements per
+  connection, so a hot query is parsed and planned once per connection
+  rather than once per request. _connect_args() turns that on only for
+  asyncpg — SQLite has no server-side plan to reuse.
+
 Session lifecycle:
   Each API request gets its own session via get_db(). The session auto-commits
   on success and rolls back on exception, ensuring data consistency.
@@ -25,11 +33,24 @@ from app.config import settings
 from app.exceptions import BankAPIError
 
 
+def _connect_args(database_url: str) -> dict:
+    """Driver-level connection arguments for the configured database."""
+    if database_url.startswith("postgresql+asyncpg"):
+        return {
+            # asyncpg's own per-connection statement cache
+            "statement_cache_size": 1024,
+            # SQLAlchemy's asyncpg adapter: prepared statements per connection
+            "prepared_statement_cache_size": 256,
+        }
+    return {}
+
+
 # Create the async engine.
 # echo=True in debug mode logs all SQL statements — invaluable for development.
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
+    connect_args=_connect_args(settings.DATABASE_URL),
 )
 
 # Session factory: creates new AsyncSession instances.
@@ -9,6 +9,8 @@ role-based access control:
       ├── get_current_account_holder (User -> AccountHolder)  [MEMBER role]
       └── require_admin (User -> User)                        [ADMIN role]
 
+  forbid_admin (JWT only)                                     [not ADMIN]
+
 Role-based access control:
   - MEMBER: Can only access their own accounts and data. Most banking
     endpoints use get_current_account_holder, which inherently scopes
@@ -21,6 +23,12 @@ Role-based access control:
 Every protected endpoint declares one of these as a parameter. FastAPI
 automatically calls the dependency, and if it fails (e.g., invalid token
 or wrong role), the request is rejected before the route handler runs.
+
+forbid_admin is a database-free pre-check for member-only routers: it
+reads the signed "role" claim and turns admins away before any query
+runs. It can only deny — a token without the claim, or with a stale
+member claim, falls through to get_current_account_holder, which checks
+the role stored in the database.
 """
 
 import uuid
@@ -137,6 +145,34 @@ async def get_current_account_holder(
     return account_holder
 
 
+def forbid_admin(token: str = Depends(oauth2_scheme)) -> None:
+    """
+    Reject admin tokens without touching the database.
+
+    Registered as a router-level dependency on member-only routers, so it
+    runs before the route's own dependencies. Only the token's signed
+    "role" claim is consulted; anything else (no claim, invalid token)
+    is left to get_current_user / get_current_account_holder.
+
+    Args:
+        token: JWT from the Authorization header.
+
+    Raises:
+        HTTPException 403: If the token was issued to an admin.
+    """
+    try:
+        role = decode_access_token(token).get("role")
+    except JWTError:
+        return
+
+    if role == UserType.ADMIN.value:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin accounts cannot access member banking endpoints. "
+                   "Use /admin/* endpoints for read-only access.",
+        )
+
+
 async def require_admin(
     user: User = Depends(get_current_user),
 ) -> User:
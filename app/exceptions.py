@@ -17,7 +17,9 @@ Exception hierarchy:
     ├── InsufficientFundsError   — debit/transfer when balance too low
     ├── AccountNotFoundError     — requested account doesn't exist
     ├── UnauthorizedAccessError  — user trying to access another's resource
-    └── DuplicateCardError       — issuing a second card for an account
+    ├── DuplicateCardError       — issuing a second card for an account
+    ├── InvalidCursorError       — statement page cursor not in that statement
+    └── InvalidTransactionError  — a transaction request the rules don't allow
 """
 
 import uuid
@@ -98,6 +100,21 @@ class DuplicateEmailError(BankAPIError):
         super().__init__(f"Email {email} is already registered")
 
 
+class InvalidCursorError(BankAPIError):
+    """Raised when a statement page cursor is not a transaction of that statement."""
+
+    def __init__(self, after_id: uuid.UUID):
+        self.after_id = after_id
+        super().__init__(f"Cursor {after_id} is not a transaction in this statement")
+
+
+class InvalidTransactionError(BankAPIError):
+    """Raised when a transaction request breaks a rule of its endpoint."""
+
+    def __init__(self, detail: str):
+        super().__init__(detail)
+
+
 class InvalidCredentialsError(BankAPIError):
     """Raised when login credentials are incorrect."""
 
@@ -177,3 +194,21 @@ def register_exception_handlers(app: FastAPI) -> None:
             status_code=401,
             content={"detail": exc.detail, "error_type": "invalid_credentials"},
         )
+
+    @app.exception_handler(InvalidCursorError)
+    async def invalid_cursor_handler(
+        request: Request, exc: InvalidCursorError
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=422,
+            content={"detail": exc.detail, "error_type": "invalid_cursor"},
+        )
+
+    @app.exception_handler(InvalidTransactionError)
+    async def invalid_transaction_handler(
+        request: Request, exc: InvalidTransactionError
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=400,
+            content={"detail": exc.detail, "error_type": "invalid_transaction"},
+        )
@@ -20,9 +20,10 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
-from app.database import engine, Base
+from app.database import engine, AsyncSessionLocal, Base
 from app.exceptions import register_exception_handlers
 from app.routers import admin, auth, account_holders, accounts, cards, statements, transactions, transfers
+from app.services import statement_service, summary_service
 
 
 @asynccontextmanager
@@ -31,9 +32,14 @@ async def lifespan(app: FastAPI):
     Application lifespan manager (replaces deprecated @app.on_event).
 
     Startup:
-      Creates all database tables if they don't exist. This is a convenience
-      for development — in production, you'd use Alembic migrations exclusively
-      so you have version-controlled, reversible schema changes.
+      Creates all database tables (and the monthly roll-up triggers) if they
+      don't exist. This is a convenience for development — in production,
+      you'd use Alembic migrations exclusively so you have
+      version-controlled, reversible schema changes.
+
+      Then backfills the monthly ledger roll-up for databases created before
+      it existed (a no-op once populated), and runs the statement queries
+      once so their compiled SQL is cached before the first request.
 
     Shutdown:
       Disposes of the database engine, closing all connections cleanly.
@@ -41,6 +47,10 @@ async def lifespan(app: FastAPI):
     # --- Startup ---
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        await summary_service.backfill_if_empty(db)
+        await db.commit()
+        await statement_service.warm_statement_queries(db)
     yield
     # --- Shutdown ---
     await engine.dispose()
@@ -13,3 +13,4 @@ from app.models.account_holder import AccountHolder  # noqa: F401
 from app.models.account import Account  # noqa: F401
 from app.models.transaction import Transaction  # noqa: F401
 from app.models.card import Card  # noqa: F401
+from app.models.monthly_account_summary import MonthlyAccountSummary  # noqa: F401
@@ -0,0 +1,197 @@
+"""
+MonthlyAccountSummary model — per-account, per-month ledger roll-up.
+
+One row per (account, year, month) holding the totals of that month's
+APPROVED transactions. It is a derived table: every row can be rebuilt
+from the transactions table at any time (see summary_service).
+
+Why it exists:
+  A statement's opening balance is the net of every approved transaction
+  before the requested month. Computing that from the transactions table
+  means scanning an account's entire history on every statement request.
+  With this roll-up, the opening balance is a sum over at most one row per
+  prior month, and only the requested month's transactions are scanned.
+
+How it stays current:
+  Database triggers on the transactions table (defined below) upsert the
+  matching row whenever an approved transaction is inserted, and adjust it
+  when a transaction's status moves into or out of "approved" (e.g. a
+  pending transfer settling or being reversed). The summary therefore
+  commits (or rolls back) together with the ledger entry it describes,
+  no matter which code path — service, bulk insert or raw SQL — wrote it.
+  Ledger rows are otherwise immutable, so amount/date edits and deletes
+  are not tracked.
+
+  The triggers are installed by an after_create hook on the metadata,
+  which runs on every Base.metadata.create_all() — including against an
+  existing database — and every statement is idempotent. SQLite uses two
+  plain triggers; PostgreSQL uses one PL/pgSQL function.
+
+Why no closing_balance column?
+  A running closing balance would have to be rewritten for every later
+  month whenever an earlier month changes (e.g. a backfill). Storing only
+  the month's own credits and debits keeps each row independent — the
+  balance at any month boundary is just SUM(credits - debits) of the
+  rows before it.
+"""
+
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import DDL, Integer, DateTime, ForeignKey, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.database import Base
+
+
+class MonthlyAccountSummary(Base):
+    __tablename__ = "monthly_account_summaries"
+
+    # Composite primary key: one row per account per calendar month (UTC)
+    account_id: Mapped[uuid.UUID] = mapped_column(
+        ForeignKey("accounts.id"),
+        primary_key=True,
+    )
+    year: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+    )
+    month: Mapped[int] = mapped_column(
+        Integer,
+        primary_key=True,
+    )
+
+    # Sum of approved credits into the account this month, in cents
+    credits_cents: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    # Sum of approved debits out of the account this month, in cents
+    debits_cents: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    # Number of approved transactions folded into this row
+    transaction_count: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=0,
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Roll-up triggers
+# ---------------------------------------------------------------------------
+# Each approved transaction contributes one leg to exactly one account:
+# credits to to_account_id, debits to from_account_id. `sign` is +1 when a
+# row becomes approved and -1 when it stops being approved. (DDL text goes
+# through %-substitution, hence the doubled %% in strftime formats.)
+
+def _sqlite_trigger(name: str, event_clause: str, when: str, sign: str) -> DDL:
+    return DDL(f"""
+        CREATE TRIGGER IF NOT EXISTS {name}
+        AFTER {event_clause} ON transactions
+        WHEN {when}
+        BEGIN
+            INSERT INTO monthly_account_summaries (
+                account_id, year, month,
+                credits_cents, debits_cents, transaction_count, updated_at
+            )
+            VALUES (
+                CASE WHEN NEW.type = 'credit' THEN NEW.to_account_id ELSE NEW.from_account_id END,
+                CAST(strftime('%%Y', NEW.created_at) AS INTEGER),
+                CAST(strftime('%%m', NEW.created_at) AS INTEGER),
+                {sign} * CASE WHEN NEW.type = 'credit' THEN NEW.amount_cents ELSE 0 END,
+                {sign} * CASE WHEN NEW.type = 'debit' THEN NEW.amount_cents ELSE 0 END,
+                {sign},
+                datetime('now')
+            )
+            ON CONFLICT (account_id, year, month) DO UPDATE SET
+                credits_cents = credits_cents + excluded.credits_cents,
+                debits_cents = debits_cents + excluded.debits_cents,
+                transaction_count = transaction_count + excluded.transaction_count,
+                updated_at = excluded.updated_at;
+        END
+    """)
+
+
+_SQLITE_TRIGGERS = [
+    _sqlite_trigger(
+        "trg_monthly_summary_insert",
+        "INSERT",
+        when="NEW.status = 'approved'",
+        sign="1",
+    ),
+    _sqlite_trigger(
+        "trg_monthly_summary_status",
+        "UPDATE OF status",
+        when="(OLD.status = 'approved') <> (NEW.status = 'approved')",
+        sign="(CASE WHEN NEW.status = 'approved' THEN 1 ELSE -1 END)",
+    ),
+]
+
+_POSTGRESQL_TRIGGERS = [
+    DDL("""
+        CREATE OR REPLACE FUNCTION monthly_summary_apply() RETURNS trigger AS $$
+        DECLARE
+            sign integer;
+            ts timestamp;
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                IF NEW.status <> 'approved' THEN
+                    RETURN NULL;
+                END IF;
+                sign := 1;
+            ELSE
+                IF (OLD.status = 'approved') = (NEW.status = 'approved') THEN
+                    RETURN NULL;
+                END IF;
+                sign := CASE WHEN NEW.status = 'approved' THEN 1 ELSE -1 END;
+            END IF;
+
+            ts := NEW.created_at AT TIME ZONE 'UTC';
+            INSERT INTO monthly_account_summaries AS s (
+                account_id, year, month,
+                credits_cents, debits_cents, transaction_count, updated_at
+            )
+            VALUES (
+                CASE WHEN NEW.type = 'credit' THEN NEW.to_account_id ELSE NEW.from_account_id END,
+                EXTRACT(YEAR FROM ts)::integer,
+                EXTRACT(MONTH FROM ts)::integer,
+                sign * CASE WHEN NEW.type = 'credit' THEN NEW.amount_cents ELSE 0 END,
+                sign * CASE WHEN NEW.type = 'debit' THEN NEW.amount_cents ELSE 0 END,
+                sign,
+                now()
+            )
+            ON CONFLICT (account_id, year, month) DO UPDATE SET
+                credits_cents = s.credits_cents + EXCLUDED.credits_cents,
+                debits_cents = s.debits_cents + EXCLUDED.debits_cents,
+                transaction_count = s.transaction_count + EXCLUDED.transaction_count,
+                updated_at = EXCLUDED.updated_at;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """),
+    DDL("DROP TRIGGER IF EXISTS trg_monthly_summary ON transactions"),
+    DDL("""
+        CREATE TRIGGER trg_monthly_summary
+        AFTER INSERT OR UPDATE OF status ON transactions
+        FOR EACH ROW EXECUTE FUNCTION monthly_summary_apply()
+    """),
+]
+
+for _ddl in _SQLITE_TRIGGERS:
+    event.listen(Base.metadata, "after_create", _ddl.execute_if(dialect="sqlite"))
+for _ddl in _POSTGRESQL_TRIGGERS:
+    event.listen(Base.metadata, "after_create", _ddl.execute_if(dialect="postgresql"))
@@ -23,6 +23,21 @@ Status field:
   The "pending" status is included for enterprise readiness — in a real bank,
   external transfers might be held for review, fraud checks, or settlement.
 
+Signed amount:
+  signed_amount_cents is a database-generated column: +amount_cents for
+  credits, -amount_cents for debits. Each row touches exactly one account,
+  so an account's net is a plain SUM(signed_amount_cents) with no CASE on
+  type. It is derived, never written by the application, and is not part
+  of the API response.
+
+Indexes:
+  Every per-account query (statements, balances, history) filters on one
+  side of the ledger plus a time window, so the account columns are indexed
+  together with created_at — a month's statement becomes an index range
+  read instead of a filter over the account's whole history. A second,
+  partial pair covers only APPROVED rows and carries signed_amount_cents,
+  so balance sums read the index alone and never touch declined rows.
+
 Why amount_cents is always positive:
   Storing a positive amount with a separate type field (credit/debit) is
   clearer than using signed integers. You never wonder "does negative mean
@@ -32,7 +47,9 @@ Why amount_cents is always positive:
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import String, Integer, DateTime, ForeignKey, CheckConstraint
+from sqlalchemy import (
+    String, Integer, DateTime, ForeignKey, CheckConstraint, Computed, Index, text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -44,6 +61,27 @@ class Transaction(Base):
     __table_args__ = (
         # Amount must always be positive — direction is indicated by type
         CheckConstraint("amount_cents > 0", name="ck_transactions_positive_amount"),
+        # Per-account time-window scans (statements, history). The leading
+        # account column also serves foreign-key lookups.
+        Index("ix_transactions_from_account_created_at", "from_account_id", "created_at"),
+        Index("ix_transactions_to_account_created_at", "to_account_id", "created_at"),
+        # Approved-only covering indexes for balance sums
+        Index(
+            "ix_transactions_from_account_approved",
+            "from_account_id",
+            "created_at",
+            "signed_amount_cents",
+            sqlite_where=text("status = 'approved'"),
+            postgresql_where=text("status = 'approved'"),
+        ),
+        Index(
+            "ix_transactions_to_account_approved",
+            "to_account_id",
+            "created_at",
+            "signed_amount_cents",
+            sqlite_where=text("status = 'approved'"),
+            postgresql_where=text("status = 'approved'"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -63,18 +101,25 @@ class Transaction(Base):
         nullable=False,
     )
 
-    # Source account (NULL for external deposits)
+    # +amount_cents for credits, -amount_cents for debits (generated by the DB)
+    signed_amount_cents: Mapped[int] = mapped_column(
+        Integer,
+        Computed(
+            "CASE WHEN type = 'credit' THEN amount_cents ELSE -amount_cents END",
+            persisted=True,
+        ),
+    )
+
+    # Source account (NULL for external deposits) — see composite indexes above
     from_account_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("accounts.id"),
         nullable=True,
-        index=True,
     )
 
-    # Destination account (NULL for withdrawals/purchases)
+    # Destination account (NULL for withdrawals/purchases) — see composite indexes above
     to_account_id: Mapped[uuid.UUID | None] = mapped_column(
         ForeignKey("accounts.id"),
         nullable=True,
-        index=True,
     )
 
     # "pending", "approved", or "declined"
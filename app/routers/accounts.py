@@ -4,6 +4,7 @@ Accounts router — bank account management endpoints for members.
 Member endpoints (require JWT, scoped to the authenticated user):
   POST   /accounts                   — Create a new account
   GET    /accounts                   — List own accounts
+  GET    /accounts/balances          — Get several own balances at once
   GET    /accounts/{account_id}      — Get own account details
   GET    /accounts/{account_id}/balance — Get own account balance
 
@@ -42,11 +43,15 @@ async def create_account(
     The account is created with a zero balance and a randomly generated
     10-digit account number. The authenticated user automatically becomes
     the owner.
+
+    Pass **initial_deposit_cents** to fund the account in the same request;
+    the deposit is recorded as an approved credit transaction.
     """
     account = await account_service.create_account(
         db=db,
         account_holder_id=account_holder.id,
         account_type=request.account_type,
+        initial_deposit_cents=request.initial_deposit_cents,
     )
     return account
 
@@ -89,6 +94,34 @@ async def lookup_account(
     return await account_service.lookup_by_account_number(db, account_number)
 
 
+@router.get(
+    "/balances",
+    response_model=list[BalanceResponse],
+    summary="Check several account balances",
+)
+async def get_balances(
+    ids: list[uuid.UUID] = Query(
+        ..., min_length=1, max_length=100, description="Account IDs (repeat the parameter)"
+    ),
+    compute: bool = Query(
+        True, description="Recompute the balances from transactions to verify the cache"
+    ),
+    account_holder: AccountHolder = Depends(get_current_account_holder),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Get the balances of several of your accounts in one request.
+
+    Pass each account as its own `ids` parameter
+    (`?ids=<uuid>&ids=<uuid>`). Balances come back in the order requested,
+    in the same shape as the single-account balance endpoint. Returns 403
+    if any account belongs to a different user, or 404 if any doesn't exist.
+    """
+    return await account_service.get_balances(
+        db, ids, account_holder.id, compute=compute
+    )
+
+
 @router.get(
     "/{account_id}",
     response_model=AccountResponse,
@@ -115,6 +148,9 @@ async def get_account(
 )
 async def get_balance(
     account_id: uuid.UUID,
+    compute: bool = Query(
+        True, description="Recompute the balance from transactions to verify the cache"
+    ),
     account_holder: AccountHolder = Depends(get_current_account_holder),
     db: AsyncSession = Depends(get_db),
 ):
@@ -124,5 +160,10 @@ async def get_balance(
     The response includes a `match` boolean indicating whether the cached
     balance agrees with the sum of all transactions. A mismatch would
     indicate a data integrity issue that needs investigation.
+
+    Pass `compute=false` to skip the recompute and return only the cached
+    balance (`computed_balance_cents` and `match` are then null).
     """
-    return await account_service.get_balance(db, account_id, account_holder.id)
+    return await account_service.get_balance(
+        db, account_id, account_holder.id, compute=compute
+    )
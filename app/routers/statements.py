@@ -2,25 +2,34 @@
 Statements router — monthly account statement generation.
 
 Endpoints:
-  GET /accounts/{account_id}/statements?year=YYYY&month=MM
+  GET /accounts/{account_id}/statements?year=YYYY&month=MM[&size=N&after_id=UUID]
 
 Generates a statement for the specified account and month. The response
 includes aggregate data (opening/closing balance, totals) at the top,
 followed by the full list of transactions for the period.
+
+The service returns the statement as already-serialized JSON chunks —
+the aggregate header first, then the transactions in database-sized
+batches (closed months come from its cache as a single chunk). The handler
+streams them as-is rather than having FastAPI buffer, re-validate and
+re-encode the whole statement. `response_model` is kept for the OpenAPI
+schema.
 """
 
 import uuid
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
-from app.dependencies import get_current_account_holder
+from app.dependencies import forbid_admin, get_current_account_holder
 from app.models.account_holder import AccountHolder
 from app.schemas.statement import StatementResponse
 from app.services import statement_service
 
-router = APIRouter()
+# Admins are turned away from the token alone, before any database work
+router = APIRouter(dependencies=[Depends(forbid_admin)])
 
 
 @router.get(
@@ -32,6 +41,12 @@ async def get_statement(
     account_id: uuid.UUID,
     year: int = Query(..., ge=2000, le=2100, description="Statement year"),
     month: int = Query(..., ge=1, le=12, description="Statement month (1-12)"),
+    size: int = Query(
+        statement_service.DEFAULT_PAGE_SIZE, ge=1, le=1000, description="Transactions per page"
+    ),
+    after_id: uuid.UUID | None = Query(
+        None, description="Resume after this transaction (the previous page's next_cursor)"
+    ),
     account_holder: AccountHolder = Depends(get_current_account_holder),
     db: AsyncSession = Depends(get_db),
 ):
@@ -43,14 +58,20 @@ async def get_statement(
     - **Closing balance**: Account balance at the end of the month
     - **Total credits/debits**: Sum of all credits and debits for the month
     - **Transaction count**: Number of transactions in the period
-    - **Transactions**: Full list of every transaction, ordered chronologically
+    - **Transactions**: Every transaction in the month, ordered chronologically
+      and paginated — up to `size` per page, with `next_cursor` pointing at
+      the next page (null on the last one)
 
-    Query parameters `year` and `month` are required.
+    Query parameters `year` and `month` are required. An `after_id` that is
+    not one of this statement's transactions is rejected with 422.
     """
-    return await statement_service.generate_statement(
+    chunks = await statement_service.stream_statement_json(
         db=db,
         account_id=account_id,
         account_holder_id=account_holder.id,
         year=year,
         month=month,
+        size=size,
+        after_id=after_id,
     )
+    return StreamingResponse(chunks, media_type="application/json")
@@ -3,6 +3,7 @@ Transactions router — create and list transactions for an account.
 
 Member endpoints (scoped to authenticated user's accounts):
   POST /accounts/{account_id}/transactions       — Create a credit or debit
+  POST /accounts/{account_id}/transactions:bulk  — Create many in one write
   GET  /accounts/{account_id}/transactions        — List transactions (with filters)
   GET  /accounts/{account_id}/transactions/{id}   — Get a single transaction
 
@@ -19,7 +20,9 @@ from app.database import get_db
 from app.dependencies import get_current_account_holder
 from app.models.account_holder import AccountHolder
 from app.schemas.transaction import (
+    TransactionBulkCreateRequest,
     TransactionCreateRequest,
+    TransactionCreateResponse,
     TransactionResponse,
 )
 from app.services import transaction_service
@@ -29,7 +32,7 @@ router = APIRouter()
 
 @router.post(
     "/{account_id}/transactions",
-    response_model=TransactionResponse,
+    response_model=TransactionCreateResponse,
     status_code=201,
     summary="Create a transaction (credit or debit)",
 )
@@ -51,9 +54,12 @@ async def create_transaction(
     Debits are rejected if the account has insufficient balance. A declined
     transaction is still recorded for audit purposes.
 
+    The response includes `new_balance_cents`, the account balance after
+    this transaction, so clients don't need a follow-up balance request.
+
     All amounts are in **integer cents** (e.g., $10.50 = 1050).
     """
-    txn = await transaction_service.create_transaction(
+    txn, new_balance_cents = await transaction_service.create_transaction(
         db=db,
         account_id=account_id,
         account_holder_id=account_holder.id,
@@ -62,7 +68,41 @@ async def create_transaction(
         description=request.description,
         card_id=request.card_id,
     )
-    return txn
+    return TransactionCreateResponse(
+        **TransactionResponse.model_validate(txn).model_dump(),
+        new_balance_cents=new_balance_cents,
+    )
+
+
+@router.post(
+    "/{account_id}/transactions:bulk",
+    response_model=list[TransactionResponse],
+    status_code=201,
+    summary="Create many transactions in one write",
+)
+async def create_transactions_bulk(
+    account_id: uuid.UUID,
+    request: TransactionBulkCreateRequest,
+    account_holder: AccountHolder = Depends(get_current_account_holder),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    Create up to 1000 credits and debits on one account in a single request.
+
+    Items are applied in order against a running balance. A debit the
+    balance can't cover is recorded as **declined** and the rest of the
+    batch still goes through — check each returned transaction's `status`.
+    Everything is written in one database transaction.
+
+    Card purchases (`card_id`) are not accepted here; use the single
+    transaction endpoint.
+    """
+    return await transaction_service.create_transactions_bulk(
+        db=db,
+        account_id=account_id,
+        account_holder_id=account_holder.id,
+        items=request.transactions,
+    )
 
 
 @router.get(
@@ -18,6 +18,11 @@ class AccountCreateRequest(BaseModel):
         default="checking",
         description="Type of bank account to create",
     )
+    initial_deposit_cents: int = Field(
+        default=0,
+        ge=0,
+        description="Optional opening deposit in cents, recorded as a credit",
+    )
 
 
 class AccountResponse(BaseModel):
@@ -53,10 +58,11 @@ class BalanceResponse(BaseModel):
 
     The `match` field indicates whether the cached balance agrees with
     the balance computed by summing all approved transactions. A mismatch
-    would indicate a data integrity issue.
+    would indicate a data integrity issue. When the recompute is skipped
+    (compute=false), computed_balance_cents and match are null.
     """
     account_id: uuid.UUID
     cached_balance_cents: int
-    computed_balance_cents: int
-    match: bool
+    computed_balance_cents: int | None
+    match: bool | None
     currency: str
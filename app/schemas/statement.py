@@ -14,12 +14,11 @@ from pydantic import BaseModel
 from app.schemas.transaction import TransactionResponse
 
 
-class StatementResponse(BaseModel):
-    """Monthly account statement.
+class StatementSummary(BaseModel):
+    """Statement header: metadata and aggregates, without the transaction list.
 
-    Aggregates appear first — these are the "header" a user sees at the
-    top of their statement. The full transaction list follows, ordered
-    chronologically so the user can scroll through every transaction.
+    Serialized on its own as the first chunk of a streamed statement.
+    Frozen: statements are read-only snapshots once built.
     """
     # --- Statement metadata ---
     account_id: uuid.UUID
@@ -33,5 +32,19 @@ class StatementResponse(BaseModel):
     total_debits_cents: int
     transaction_count: int
 
-    # --- Full transaction list (scrollable) ---
+    model_config = {"frozen": True}
+
+
+class StatementResponse(StatementSummary):
+    """Monthly account statement.
+
+    Aggregates appear first — these are the "header" a user sees at the
+    top of their statement, covering the whole month. The transaction list
+    follows, ordered chronologically and paginated with next_cursor.
+    """
+    # --- Transaction list (one page, oldest first) ---
     transactions: list[TransactionResponse]
+
+    # ID of the last transaction on this page; pass it back as `after_id`
+    # to fetch the next page. Null when this is the last page.
+    next_cursor: uuid.UUID | None = None
@@ -21,6 +21,15 @@ class TransactionCreateRequest(BaseModel):
     )
 
 
+class TransactionBulkCreateRequest(BaseModel):
+    """Request body for POST /accounts/{id}/transactions:bulk."""
+    transactions: list[TransactionCreateRequest] = Field(
+        min_length=1,
+        max_length=1000,
+        description="Credits and debits to apply in order (no card purchases)",
+    )
+
+
 class TransactionResponse(BaseModel):
     """Public representation of a transaction."""
     id: uuid.UUID
@@ -34,7 +43,14 @@ class TransactionResponse(BaseModel):
     card_id: uuid.UUID | None
     created_at: datetime
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
+
+
+class TransactionCreateResponse(TransactionResponse):
+    """Response body for POST /accounts/{id}/transactions."""
+    new_balance_cents: int = Field(
+        description="Account balance after this transaction, in cents"
+    )
 
 
 class TransferRequest(BaseModel):
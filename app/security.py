@@ -17,6 +17,8 @@ audit and update. Three concerns are handled here:
    - The token is signed with SECRET_KEY using HS256 (HMAC-SHA256)
    - Tokens expire after ACCESS_TOKEN_EXPIRE_MINUTES (default: 30 min)
    - The server is stateless: no session storage needed
+   - Verified claims are memoized per token string, so a client sending the
+     same token on every request pays for one HMAC check, not one per call
 
 3. FERNET ENCRYPTION (AES-128-CBC + HMAC-SHA256)
    - Used for encrypting sensitive card data at rest (card numbers, CVVs)
@@ -30,10 +32,13 @@ Enterprise note:
   This implementation is structured to make that migration straightforward.
 """
 
+import functools
+import time
 from datetime import datetime, timedelta, timezone
 
 from cryptography.fernet import Fernet
 from jose import JWTError, jwt
+from jose.exceptions import ExpiredSignatureError
 from passlib.context import CryptContext
 
 from app.config import settings
@@ -95,6 +100,7 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
     The token payload contains:
       - "sub": The subject (user ID as string) — standard JWT claim
       - "exp": Expiration timestamp — after this, the token is rejected
+      - any extra claims the caller passes (e.g. "role")
 
     Args:
         data: Dictionary of claims to encode (must include "sub").
@@ -117,17 +123,41 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
     return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
+@functools.lru_cache(maxsize=128)
+def _verify_access_token(token: str) -> dict:
+    """
+    Verify a token's signature and claims, memoized by token string.
+
+    Only successful decodes are cached — lru_cache never stores a call
+    that raised, so forged or malformed tokens are re-checked every time.
+    The cache is bounded, and entries are useless once the token's "exp"
+    passes, which decode_access_token enforces on every hit.
+    """
+    return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+
 def decode_access_token(token: str) -> dict:
     """
     Decode and verify a JWT access token.
 
+    The signature check is cached (see _verify_access_token), but expiry
+    is re-evaluated on each call so a cached token stops working the
+    moment it expires.
+
     Raises:
         JWTError: If the token is expired, tampered with, or invalid.
 
     Returns:
         The decoded payload dictionary (contains "sub", "exp", etc.).
     """
-    return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    payload = _verify_access_token(token)
+
+    exp = payload.get("exp")
+    if exp is not None and exp <= time.time():
+        raise ExpiredSignatureError("Signature has expired.")
+
+    # Hand out a copy so callers can't mutate the cached claims
+    return dict(payload)
 
 
 # ---------------------------------------------------------------------------
@@ -2,9 +2,11 @@
 Account service — business logic for bank account operations.
 
 This module handles:
-  - Account creation (with unique account number generation)
+  - Account creation (with unique account number generation and an
+    optional opening deposit)
   - Account retrieval (single or list, scoped to an account holder)
-  - Balance verification (cached vs. computed from transactions)
+  - Balance verification (cached vs. computed from transactions), for one
+    account or several at once
 
 Ownership enforcement:
   All query functions accept an `account_holder_id` parameter. This is
@@ -26,11 +28,12 @@ import uuid
 import random
 import string
 
-from sqlalchemy import select, func
+from sqlalchemy import select, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.exceptions import AccountNotFoundError, UnauthorizedAccessError
 from app.models.account import Account
+from app.models.transaction import Transaction
 
 
 def _generate_account_number() -> str:
@@ -48,16 +51,21 @@ async def create_account(
     db: AsyncSession,
     account_holder_id: uuid.UUID,
     account_type: str = "checking",
+    initial_deposit_cents: int = 0,
 ) -> Account:
     """
     Create a new bank account for an account holder.
 
     Generates a unique account number and initializes balance to 0 cents.
+    A positive initial_deposit_cents is recorded as an approved credit and
+    applied to the cached balance in the same DB transaction as the account
+    row, so the account never exists unfunded.
 
     Args:
         db: Database session.
         account_holder_id: The owner's account holder ID.
         account_type: "checking" or "savings".
+        initial_deposit_cents: Opening deposit in cents (0 for none).
 
     Returns:
         The newly created Account instance.
@@ -81,6 +89,18 @@ async def create_account(
     )
     db.add(account)
     await db.flush()
+
+    if initial_deposit_cents > 0:
+        account.cached_balance_cents = initial_deposit_cents
+        db.add(Transaction(
+            type="credit",
+            amount_cents=initial_deposit_cents,
+            to_account_id=account.id,
+            status="approved",
+            description="Initial deposit",
+        ))
+        await db.flush()
+
     return account
 
 
@@ -157,6 +177,7 @@ async def get_balance(
     db: AsyncSession,
     account_id: uuid.UUID,
     account_holder_id: uuid.UUID,
+    compute: bool = True,
 ) -> dict:
     """
     Get the account balance — both cached and computed from transactions.
@@ -165,10 +186,24 @@ async def get_balance(
     and subtracting all approved debits. If it doesn't match the cached
     balance, that signals a data integrity issue.
 
+    The recompute aggregates the account's whole history, so callers that
+    only need the current balance can pass compute=False to get the cached
+    value from the single account-row read.
+
     Returns:
         Dict with cached_balance_cents, computed_balance_cents, match, currency.
+        computed_balance_cents and match are None when compute is False.
     """
     account = await get_account(db, account_id, account_holder_id)
+    if not compute:
+        return {
+            "account_id": account.id,
+            "cached_balance_cents": account.cached_balance_cents,
+            "computed_balance_cents": None,
+            "match": None,
+            "currency": account.currency,
+        }
+
     computed_balance_cents = await _compute_balance_from_transactions(db, account_id)
 
     return {
@@ -180,6 +215,78 @@ async def get_balance(
     }
 
 
+async def get_balances(
+    db: AsyncSession,
+    account_ids: list[uuid.UUID],
+    account_holder_id: uuid.UUID,
+    compute: bool = True,
+) -> list[dict]:
+    """
+    Get the balances of several accounts in one round trip.
+
+    The multi-account counterpart to get_balance(): the accounts are loaded
+    with one query, and the computed balances come from one grouped SUM
+    over their approved transactions rather than one scan per account.
+    Every account must exist and belong to the caller.
+
+    Args:
+        db: Database session.
+        account_ids: The accounts to read, in the order to return them.
+            Duplicates are returned once.
+        account_holder_id: The authenticated user's account holder ID.
+        compute: Whether to recompute each balance from transactions.
+
+    Returns:
+        One balance dict per account (same shape as get_balance()).
+
+    Raises:
+        AccountNotFoundError: If any account doesn't exist.
+        UnauthorizedAccessError: If any account belongs to someone else.
+    """
+    account_ids = list(dict.fromkeys(account_ids))
+    result = await db.execute(select(Account).where(Account.id.in_(account_ids)))
+    accounts = {account.id: account for account in result.scalars()}
+
+    for account_id in account_ids:
+        account = accounts.get(account_id)
+        if account is None:
+            raise AccountNotFoundError(account_id)
+        if account.account_holder_id != account_holder_id:
+            raise UnauthorizedAccessError("You do not have access to this account")
+
+    computed: dict[uuid.UUID, int] = {}
+    if compute:
+        # Every row touches exactly one account (credits in, debits out)
+        leg_account = func.coalesce(Transaction.to_account_id, Transaction.from_account_id)
+        totals = await db.execute(
+            select(leg_account, func.sum(Transaction.signed_amount_cents))
+            .where(
+                or_(
+                    Transaction.to_account_id.in_(account_ids),
+                    Transaction.from_account_id.in_(account_ids),
+                )
+            )
+            .where(Transaction.status == "approved")
+            .group_by(leg_account)
+        )
+        computed = {account_id: total for account_id, total in totals}
+
+    balances = []
+    for account_id in account_ids:
+        account = accounts[account_id]
+        computed_balance_cents = computed.get(account_id, 0) if compute else None
+        balances.append({
+            "account_id": account.id,
+            "cached_balance_cents": account.cached_balance_cents,
+            "computed_balance_cents": computed_balance_cents,
+            "match": (
+                account.cached_balance_cents == computed_balance_cents if compute else None
+            ),
+            "currency": account.currency,
+        })
+    return balances
+
+
 async def _compute_balance_from_transactions(
     db: AsyncSession,
     account_id: uuid.UUID,
@@ -197,25 +304,20 @@ async def _compute_balance_from_transactions(
     except ImportError:
         return 0
 
-    # Sum approved credits to this account
-    credit_result = await db.execute(
-        select(func.coalesce(func.sum(Transaction.amount_cents), 0))
-        .where(Transaction.to_account_id == account_id)
-        .where(Transaction.status == "approved")
-        .where(Transaction.type == "credit")
-    )
-    total_credits = credit_result.scalar()
-
-    # Sum approved debits from this account
-    debit_result = await db.execute(
-        select(func.coalesce(func.sum(Transaction.amount_cents), 0))
-        .where(Transaction.from_account_id == account_id)
+    # Every row touches one side of one account, and the generated
+    # signed_amount_cents already carries the direction — one SUM covers
+    # credits in and debits out.
+    result = await db.execute(
+        select(func.coalesce(func.sum(Transaction.signed_amount_cents), 0))
+        .where(
+            or_(
+                Transaction.to_account_id == account_id,
+                Transaction.from_account_id == account_id,
+            )
+        )
         .where(Transaction.status == "approved")
-        .where(Transaction.type == "debit")
     )
-    total_debits = debit_result.scalar()
-
-    return total_credits - total_debits
+    return result.scalar()
 
 
 # ---------------------------------------------------------------------------
@@ -22,6 +22,9 @@ Security notes:
   - Login returns the same error for "wrong password" and "email not found"
     to prevent user enumeration attacks
   - JWT tokens are stateless — no server-side session storage needed
+  - Tokens carry the user's role ("role" claim) as of issue time. It is
+    only used to reject admins early (see dependencies.forbid_admin);
+    every grant of access still checks the role stored in the database
 """
 
 import uuid
@@ -91,7 +94,7 @@ async def signup(
     await db.flush()
 
     # Generate JWT token — "sub" (subject) is the standard claim for user identity
-    token = create_access_token(data={"sub": str(user.id)})
+    token = create_access_token(data={"sub": str(user.id), "role": user.user_type.value})
 
     return user, token
 
@@ -131,5 +134,5 @@ async def login(
     if not user.is_active:
         raise InvalidCredentialsError()
 
-    token = create_access_token(data={"sub": str(user.id)})
+    token = create_access_token(data={"sub": str(user.id), "role": user.user_type.value})
     return user, token
@@ -2,139 +2,488 @@
 Statement service — monthly account statement generation.
 
 Generates a statement for a specific account and month by:
-  1. Querying all transactions in the date range
-  2. Computing the opening balance (sum of all approved transactions before the month)
-  3. Computing closing balance (opening + net of the month's transactions)
-  4. Aggregating total credits and debits for the period
+  1. Computing the opening balance (net of all approved activity before the month)
+     and the month's total credits, debits and count in a single CTE query
+  2. Computing closing balance (opening + net of the month's transactions)
+  3. Querying the month's transactions for the chronological list
 
-The opening balance is calculated from the transaction history rather than
-stored separately. This ensures the statement is always consistent with
-the actual transaction records — no stale cached values.
+All arithmetic over transaction rows happens in the database — Python only
+receives one aggregate row plus the rows it has to return.
+
+The opening balance is read from the monthly ledger roll-up
+(monthly_account_summaries) rather than by re-summing every prior
+transaction. The roll-up is written in the same database transaction as
+each ledger entry, so it is always consistent with the transaction
+records — only the requested month's transactions are scanned.
+
+Streaming:
+  stream_statement_json() returns the statement as an async iterator of
+  JSON chunks: the aggregate header first, then the transaction list read
+  from the database in batches of STREAM_BATCH_SIZE rows. Memory use is
+  bounded by the batch size rather than the number of transactions in the
+  month, and the client starts receiving bytes before the last row has
+  been fetched. The ownership check and aggregates (a single query) run
+  before the iterator is returned, so errors still surface as normal 4xx
+  responses. When the
+  header's transaction_count is zero the list query is skipped entirely,
+  so an empty month costs a single (index-only) aggregate probe.
+
+Pagination:
+  The transaction list is paged with a keyset cursor rather than OFFSET:
+  rows are ordered by (created_at, id) and a page resumes strictly after
+  the cursor transaction, so every page is an index range read no matter
+  how deep into the month it starts. The aggregates always describe the
+  whole month.
+
+  Rows are selected as plain column tuples (no ORM identity map) in
+  TransactionResponse field order and encoded with orjson, so no Pydantic
+  model is built per transaction. orjson's OPT_UTC_Z matches Pydantic's
+  datetime format, so the bytes are the same as the model would produce.
+  The header is likewise built with model_construct(): its values come
+  straight from typed columns, so validating them again is wasted work.
+
+Closed-month cache:
+  Once a month is over its statement can no longer change — transactions
+  are always stamped with the current time, so nothing new lands in a past
+  month. The one exception is a write stamped just before the month ended
+  that commits just after, possibly in another process and so out of reach
+  of this process's invalidation. A month therefore only counts as closed
+  once STATEMENT_CACHE_GRACE_SECONDS have passed since it ended, which
+  covers in-flight transactions and clock skew between workers.
+
+  The serialized JSON of closed-month statements is kept in a per-process
+  LRU keyed by (account_id, year, month), so a repeat fetch costs only the
+  ownership check. Only the first page at DEFAULT_PAGE_SIZE is cached —
+  what a plain statement request returns — so every entry is bounded by
+  that page size; later pages and custom sizes are always generated fresh. The current month, any future month and a month still
+  inside its grace period are always generated fresh. The only other way
+  history changes is a roll-up rebuild, which clears this process's cache
+  (other workers keep theirs until restart).
 
 Enterprise note:
-  In production, statements might be pre-generated and cached (or stored
-  as PDFs) at month-end for performance. This on-demand approach is
-  correct and sufficient for the MVP.
+  In production, statements might be pre-generated (or stored as PDFs) at
+  month-end and shared across processes (e.g. Redis). The in-process LRU
+  gives the same effect for a single worker.
 """
 
 import uuid
-from datetime import datetime, timezone
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select, func, and_, or_
+import orjson
+from sqlalchemy import select, func, case, and_, or_, true, bindparam
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from app.exceptions import AccountNotFoundError, UnauthorizedAccessError
+from app.config import settings
+from app.exceptions import AccountNotFoundError, InvalidCursorError, UnauthorizedAccessError
 from app.models.account import Account
 from app.models.transaction import Transaction
+from app.schemas.statement import StatementSummary
+from app.schemas.transaction import TransactionResponse
+from app.services import summary_service
 
+# Rows fetched from the database per round-trip while streaming
+STREAM_BATCH_SIZE = 500
 
-async def generate_statement(
-    db: AsyncSession,
-    account_id: uuid.UUID,
-    account_holder_id: uuid.UUID,
-    year: int,
-    month: int,
-) -> dict:
-    """
-    Generate a monthly statement for an account.
-
-    Args:
-        db: Database session.
-        account_id: The account to generate the statement for.
-        account_holder_id: For ownership verification.
-        year: Statement year (e.g., 2026).
-        month: Statement month (1-12).
+# Transactions per statement page unless the client asks otherwise
+DEFAULT_PAGE_SIZE = 100
 
-    Returns:
-        Dictionary matching StatementResponse schema.
+# Transaction columns in TransactionResponse field order, so each streamed
+# row maps straight onto the response shape
+_RESPONSE_COLUMNS = tuple(
+    getattr(Transaction, field) for field in TransactionResponse.model_fields
+)
 
-    Raises:
-        AccountNotFoundError: If the account doesn't exist.
-        UnauthorizedAccessError: If the account belongs to someone else.
-    """
-    # Verify ownership
-    result = await db.execute(
-        select(Account).where(Account.id == account_id)
-    )
-    account = result.scalar_one_or_none()
+# Serialized closed-month statements (first page at the default size),
+# least recently used first. Keyed by (account_id, year, month).
+_closed_statements: OrderedDict[tuple, bytes] = OrderedDict()
 
-    if account is None:
-        raise AccountNotFoundError(account_id)
-    if account.account_holder_id != account_holder_id:
-        raise UnauthorizedAccessError("You do not have access to this account")
 
-    # Calculate date boundaries for the requested month
+def _month_bounds(year: int, month: int) -> tuple[datetime, datetime]:
+    """The UTC instants [start, end) of a calendar month."""
     month_start = datetime(year, month, 1, tzinfo=timezone.utc)
     if month == 12:
         month_end = datetime(year + 1, 1, 1, tzinfo=timezone.utc)
     else:
         month_end = datetime(year, month + 1, 1, tzinfo=timezone.utc)
+    return month_start, month_end
 
-    # --- Opening balance: sum of all approved transactions BEFORE this month ---
-    # Credits add to balance, debits subtract
-    pre_month_credits = await db.execute(
-        select(func.coalesce(func.sum(Transaction.amount_cents), 0))
-        .where(
-            and_(
-                Transaction.to_account_id == account_id,
-                Transaction.status == "approved",
-                Transaction.created_at < month_start,
-            )
-        )
+
+def _is_closed_month(year: int, month: int) -> bool:
+    """True once (year, month) ended at least STATEMENT_CACHE_GRACE_SECONDS ago."""
+    _, month_end = _month_bounds(year, month)
+    settled_at = month_end + timedelta(seconds=settings.STATEMENT_CACHE_GRACE_SECONDS)
+    return datetime.now(timezone.utc) >= settled_at
+
+
+def invalidate_statement_cache() -> None:
+    """Drop every cached statement (e.g. after the roll-up is rebuilt)."""
+    _closed_statements.clear()
+
+
+async def _verify_ownership(
+    db: AsyncSession,
+    account_id: uuid.UUID,
+    account_holder_id: uuid.UUID,
+) -> None:
+    """Raise unless the account exists and belongs to the account holder."""
+    owner_id = await db.scalar(
+        select(Account.account_holder_id).where(Account.id == account_id)
     )
-    pre_credits = pre_month_credits.scalar()
+    _check_owner(account_id, owner_id, account_holder_id)
 
-    pre_month_debits = await db.execute(
-        select(func.coalesce(func.sum(Transaction.amount_cents), 0))
-        .where(
-            and_(
-                Transaction.from_account_id == account_id,
-                Transaction.status == "approved",
-                Transaction.created_at < month_start,
-            )
-        )
+
+def _check_owner(
+    account_id: uuid.UUID,
+    owner_id: uuid.UUID | None,
+    account_holder_id: uuid.UUID,
+) -> None:
+    """Raise 404 for a missing account (owner_id None), 403 for someone else's."""
+    if owner_id is None:
+        raise AccountNotFoundError(account_id)
+    if owner_id != account_holder_id:
+        raise UnauthorizedAccessError("You do not have access to this account")
+
+
+# ---------------------------------------------------------------------------
+# Prebuilt statements
+# ---------------------------------------------------------------------------
+# The statement queries are built once at import with bindparam()
+# placeholders and executed with per-request values. Every request then
+# hands the engine the same statement object, so SQLAlchemy's compiled
+# cache (and, on PostgreSQL, the driver's prepared-statement cache) is hit
+# without rebuilding the construct or re-deriving its cache key shape.
+
+def _in_month(txn):
+    """Rows of `txn` touching :account_id in [:month_start, :month_end)."""
+    return and_(
+        or_(
+            txn.from_account_id == bindparam("account_id"),
+            txn.to_account_id == bindparam("account_id"),
+        ),
+        txn.created_at >= bindparam("month_start"),
+        txn.created_at < bindparam("month_end"),
     )
-    pre_debits = pre_month_debits.scalar()
 
-    opening_balance = pre_credits - pre_debits
 
-    # --- Transactions in the requested month ---
-    month_txns_result = await db.execute(
-        select(Transaction)
-        .where(
-            and_(
-                or_(
-                    Transaction.from_account_id == account_id,
-                    Transaction.to_account_id == account_id,
-                ),
-                Transaction.created_at >= month_start,
-                Transaction.created_at < month_end,
-            )
+# Every transaction touching :account_id in [:month_start, :month_end)
+_IN_MONTH = _in_month(Transaction)
+
+# The page cursor :after_id, only if it is one of this statement's rows —
+# another account's (or month's) transaction must not steer the page
+_cursor_txn = aliased(Transaction, name="cursor_txn")
+_CURSOR_ROW = select(_cursor_txn.created_at).where(
+    _cursor_txn.id == bindparam("after_id"),
+    _in_month(_cursor_txn),
+)
+
+
+def _build_summary_statement():
+    """
+    Statement header (metadata and aggregates) as one CTE query.
+
+    Shaped as CTEs so the database sees the whole plan at once:
+
+        WITH owner    AS (the account's holder, if the account exists),
+             prior    AS (opening balance from the monthly roll-up),
+             month_tx AS (the month's rows touching this account),
+             totals   AS (approved credits/debits and row count over month_tx)
+        SELECT owner_id, opening_balance, total_credits, total_debits,
+               transaction_count, cursor_found
+        FROM prior, totals LEFT JOIN owner
+
+    cursor_found says whether :after_id is one of the month's rows for
+    this account (false when no cursor is bound), so a bad cursor is
+    rejected before streaming starts without a query of its own.
+
+    Aggregates always yield exactly one row, so owner_id comes back NULL
+    for a missing account. The ownership check therefore rides along with
+    the aggregates instead of costing its own round-trip, and both read the
+    account in the same statement.
+
+    The transaction list itself is streamed by a separate query — folding
+    it in as a JSON aggregate would materialize the whole month in a
+    single value, which is exactly what streaming avoids.
+    """
+    owner = (
+        select(Account.account_holder_id.label("owner_id"))
+        .where(Account.id == bindparam("account_id"))
+        .cte("owner")
+    )
+
+    prior = summary_service.opening_balance_query(
+        bindparam("account_id"), bindparam("year"), bindparam("month")
+    ).cte("prior")
+
+    month_tx = (
+        select(
+            Transaction.from_account_id,
+            Transaction.to_account_id,
+            Transaction.amount_cents,
+            Transaction.status,
         )
-        .order_by(Transaction.created_at.asc())
+        .where(_IN_MONTH)
+        .cte("month_tx")
     )
-    transactions = list(month_txns_result.scalars().all())
 
-    # --- Aggregate the month's approved transactions ---
-    total_credits = sum(
-        t.amount_cents for t in transactions
-        if t.to_account_id == account_id and t.status == "approved"
+    # Declined transactions are counted but never move money
+    approved_credit = and_(
+        month_tx.c.to_account_id == bindparam("account_id"),
+        month_tx.c.status == "approved",
+    )
+    approved_debit = and_(
+        month_tx.c.from_account_id == bindparam("account_id"),
+        month_tx.c.status == "approved",
     )
-    total_debits = sum(
-        t.amount_cents for t in transactions
-        if t.from_account_id == account_id and t.status == "approved"
+    totals = select(
+        func.coalesce(
+            func.sum(case((approved_credit, month_tx.c.amount_cents), else_=0)), 0
+        ).label("total_credits"),
+        func.coalesce(
+            func.sum(case((approved_debit, month_tx.c.amount_cents), else_=0)), 0
+        ).label("total_debits"),
+        func.count().label("transaction_count"),
+    ).cte("totals")
+
+    return select(
+        owner.c.owner_id,
+        prior.c.opening_balance,
+        totals.c.total_credits,
+        totals.c.total_debits,
+        totals.c.transaction_count,
+        _CURSOR_ROW.exists().label("cursor_found"),
+    ).select_from(prior.join(totals, true()).outerjoin(owner, true()))
+
+
+_STATEMENT_SUMMARY = _build_summary_statement()
+
+# The month's rows as plain columns in response order. Ordered by
+# (created_at, id) so the order is total and a page can resume strictly
+# after the last row of the previous one.
+_MONTH_ROWS = (
+    select(*_RESPONSE_COLUMNS)
+    .where(_IN_MONTH)
+    .order_by(Transaction.created_at.asc(), Transaction.id.asc())
+)
+
+# One page of the month's rows, streamed in batches. Fetches :limit rows —
+# callers ask for one more than the page size to learn whether another
+# page follows.
+_MONTH_PAGE_FIRST = _MONTH_ROWS.limit(bindparam("limit"))
+
+# Keyset continuation: rows after the cursor transaction :after_id
+_cursor = _CURSOR_ROW.scalar_subquery()
+_MONTH_PAGE_AFTER = (
+    select(*_RESPONSE_COLUMNS)
+    .where(
+        _IN_MONTH,
+        or_(
+            Transaction.created_at > _cursor,
+            and_(
+                Transaction.created_at == _cursor,
+                Transaction.id > bindparam("after_id"),
+            ),
+        ),
     )
+    .order_by(Transaction.created_at.asc(), Transaction.id.asc())
+    .limit(bindparam("limit"))
+)
+
 
-    closing_balance = opening_balance + total_credits - total_debits
+def _statement_params(
+    account_id: uuid.UUID,
+    year: int,
+    month: int,
+    after_id: uuid.UUID | None = None,
+) -> dict:
+    """Bind values for the prebuilt statement queries."""
+    month_start, month_end = _month_bounds(year, month)
+
+    return {
+        "account_id": account_id,
+        "year": year,
+        "month": month,
+        "month_start": month_start,
+        "month_end": month_end,
+        "after_id": after_id,
+    }
+
+
+async def _statement_summary(
+    db: AsyncSession,
+    account_id: uuid.UUID,
+    account_holder_id: uuid.UUID,
+    year: int,
+    month: int,
+    after_id: uuid.UUID | None = None,
+) -> dict:
+    """
+    Check ownership and the page cursor, and compute the statement header,
+    in one query.
+
+    Raises:
+        AccountNotFoundError: If the account doesn't exist.
+        UnauthorizedAccessError: If the account belongs to someone else.
+        InvalidCursorError: If after_id is not one of the month's transactions
+                            on this account.
+    """
+    aggregates = (
+        await db.execute(
+            _STATEMENT_SUMMARY, _statement_params(account_id, year, month, after_id)
+        )
+    ).one()
+    _check_owner(account_id, aggregates.owner_id, account_holder_id)
+    if after_id is not None and not aggregates.cursor_found:
+        raise InvalidCursorError(after_id)
 
     return {
         "account_id": account_id,
         "year": year,
         "month": month,
-        "opening_balance_cents": opening_balance,
-        "closing_balance_cents": closing_balance,
-        "total_credits_cents": total_credits,
-        "total_debits_cents": total_debits,
-        "transaction_count": len(transactions),
-        "transactions": transactions,
+        "opening_balance_cents": aggregates.opening_balance,
+        "closing_balance_cents": (
+            aggregates.opening_balance + aggregates.total_credits - aggregates.total_debits
+        ),
+        "total_credits_cents": aggregates.total_credits,
+        "total_debits_cents": aggregates.total_debits,
+        "transaction_count": aggregates.transaction_count,
     }
+
+
+async def warm_statement_queries(db: AsyncSession) -> None:
+    """
+    Run the statement queries once so their compiled form is cached.
+
+    Called at startup; uses an account ID that matches nothing, so it reads
+    no rows. The first real statement request then skips SQL compilation
+    (and, on PostgreSQL, statement preparation on that connection).
+    """
+    now = datetime.now(timezone.utc)
+    params = _statement_params(uuid.UUID(int=0), now.year, now.month)
+    await db.execute(_STATEMENT_SUMMARY, params)
+    for page in (_MONTH_PAGE_FIRST, _MONTH_PAGE_AFTER):
+        result = await db.stream(page, {**params, "limit": 1, "after_id": uuid.UUID(int=0)})
+        await result.all()
+
+
+async def _stream_body(
+    db: AsyncSession,
+    summary: dict,
+    size: int,
+    after_id: uuid.UUID | None,
+) -> AsyncIterator[bytes]:
+    """Yield the statement JSON: header first, then one chunk per row batch."""
+    # The header is built from typed columns, so skip re-validating it
+    header = StatementSummary.model_construct(**summary).model_dump_json()
+
+    # Empty month: the header's count already proves there are no rows
+    if summary["transaction_count"] == 0:
+        yield header[:-1].encode() + b',"transactions":[],"next_cursor":null}'
+        return
+
+    # Re-open the header object to append the transactions array
+    yield header[:-1].encode() + b',"transactions":['
+
+    params = _statement_params(
+        summary["account_id"], summary["year"], summary["month"], after_id
+    )
+    params["limit"] = size + 1
+    page = _MONTH_PAGE_FIRST if after_id is None else _MONTH_PAGE_AFTER
+    result = await db.stream(
+        page,
+        params,
+        execution_options={"yield_per": STREAM_BATCH_SIZE},
+    )
+
+    emitted = 0
+    has_more = False
+    last_id = None
+    async for batch in result.mappings().partitions():
+        rows = [dict(row) for row in batch[: size - emitted]]
+        has_more = has_more or len(batch) > len(rows)
+        if not rows:
+            continue
+        # Encode the batch as one array, then drop its brackets
+        items = orjson.dumps(rows, option=orjson.OPT_UTC_Z)[1:-1]
+        yield items if emitted == 0 else b"," + items
+        emitted += len(rows)
+        last_id = rows[-1]["id"]
+
+    next_cursor = orjson.dumps(last_id if has_more else None)
+    yield b'],"next_cursor":' + next_cursor + b"}"
+
+
+async def _cache_body(
+    key: tuple,
+    chunks: AsyncIterator[bytes],
+) -> AsyncIterator[bytes]:
+    """Pass chunks through, storing the complete body once fully streamed."""
+    parts = []
+    async for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+
+    _closed_statements[key] = b"".join(parts)
+    while len(_closed_statements) > settings.STATEMENT_CACHE_SIZE:
+        _closed_statements.popitem(last=False)
+
+
+async def _single_chunk(body: bytes) -> AsyncIterator[bytes]:
+    yield body
+
+
+async def stream_statement_json(
+    db: AsyncSession,
+    account_id: uuid.UUID,
+    account_holder_id: uuid.UUID,
+    year: int,
+    month: int,
+    size: int = DEFAULT_PAGE_SIZE,
+    after_id: uuid.UUID | None = None,
+) -> AsyncIterator[bytes]:
+    """
+    Return a monthly statement as an async iterator of StatementResponse JSON.
+
+    Ownership is verified and the aggregates are computed before returning,
+    so failures raise here rather than mid-stream. The transaction list is
+    read lazily as the iterator is consumed, which requires the session to
+    stay open until the response has been sent.
+
+    The aggregates always cover the whole month; the transaction list is
+    one page of at most `size` rows, starting after the transaction
+    `after_id` (the previous page's next_cursor). next_cursor is null on
+    the last page.
+
+    A closed month's default first page is served from the in-process
+    cache when present; ownership is verified on every call, cached or
+    not. Uncached, the ownership check is part of the aggregate query
+    rather than a query of its own.
+
+    Raises:
+        AccountNotFoundError: If the account doesn't exist.
+        UnauthorizedAccessError: If the account belongs to someone else.
+        InvalidCursorError: If after_id is not one of the month's transactions
+                            on this account.
+    """
+    key = (account_id, year, month)
+    cacheable = (
+        settings.STATEMENT_CACHE_SIZE > 0
+        and size == DEFAULT_PAGE_SIZE
+        and after_id is None
+        and _is_closed_month(year, month)
+    )
+    if cacheable and key in _closed_statements:
+        _closed_statements.move_to_end(key)
+        body = _closed_statements[key]
+        await _verify_ownership(db, account_id, account_holder_id)
+        return _single_chunk(body)
+
+    summary = await _statement_summary(
+        db, account_id, account_holder_id, year, month, after_id
+    )
+    chunks = _stream_body(db, summary, size, after_id)
+    if cacheable:
+        chunks = _cache_body(key, chunks)
+    return chunks
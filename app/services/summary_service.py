@@ -0,0 +1,134 @@
+"""
+Summary service — maintains the monthly_account_summaries roll-up.
+
+The roll-up (see app/models/monthly_account_summary.py) lets statements
+compute an opening balance without scanning an account's full history.
+Day-to-day it is kept current by database triggers on the transactions
+table, in the same DB transaction that records each ledger entry, so
+the two can never disagree. This module holds the rest:
+
+  - rebuild_monthly_summaries(): recompute every row from the transactions
+    table. Used to backfill databases that predate the roll-up.
+  - opening_balance_query(): net of all summarized months before a given
+    one, for statements to embed in their aggregate query.
+"""
+
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import Select, and_, delete, extract, func, literal, or_, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.monthly_account_summary import MonthlyAccountSummary
+from app.models.transaction import Transaction
+
+
+def opening_balance_query(account_id: uuid.UUID, year: int, month: int) -> Select:
+    """
+    Build the SELECT for an account's balance at the start of a month.
+
+    Sums (credits - debits) over the summary rows strictly before
+    (year, month) — one row per active prior month, regardless of how
+    many transactions those months contain. Returned unexecuted, with its
+    single column labelled "opening_balance", so callers can embed it as a
+    subquery or CTE in a larger statement.
+    """
+    return select(
+        func.coalesce(
+            func.sum(MonthlyAccountSummary.credits_cents - MonthlyAccountSummary.debits_cents),
+            0,
+        ).label("opening_balance")
+    ).where(
+        MonthlyAccountSummary.account_id == account_id,
+        or_(
+            MonthlyAccountSummary.year < year,
+            and_(
+                MonthlyAccountSummary.year == year,
+                MonthlyAccountSummary.month < month,
+            ),
+        ),
+    )
+
+
+async def rebuild_monthly_summaries(db: AsyncSession) -> None:
+    """
+    Recompute the entire roll-up from the transactions table.
+
+    Deletes every summary row, then re-inserts them with a single
+    INSERT ... SELECT grouped by account and calendar month. Runs inside
+    the caller's transaction, so readers never see a half-built table.
+
+    Rebuilding can change historical opening balances, so cached
+    closed-month statements are dropped as well.
+    """
+    from app.services import statement_service
+
+    # Each approved transaction contributes one "leg" to exactly one account
+    credit_legs = select(
+        Transaction.to_account_id.label("account_id"),
+        Transaction.created_at.label("created_at"),
+        Transaction.amount_cents.label("credits_cents"),
+        literal(0).label("debits_cents"),
+    ).where(
+        Transaction.status == "approved",
+        Transaction.type == "credit",
+        Transaction.to_account_id.is_not(None),
+    )
+    debit_legs = select(
+        Transaction.from_account_id.label("account_id"),
+        Transaction.created_at.label("created_at"),
+        literal(0).label("credits_cents"),
+        Transaction.amount_cents.label("debits_cents"),
+    ).where(
+        Transaction.status == "approved",
+        Transaction.type == "debit",
+        Transaction.from_account_id.is_not(None),
+    )
+    legs = union_all(credit_legs, debit_legs).subquery()
+
+    year = extract("year", legs.c.created_at)
+    month = extract("month", legs.c.created_at)
+    monthly_totals = select(
+        legs.c.account_id,
+        year,
+        month,
+        func.sum(legs.c.credits_cents),
+        func.sum(legs.c.debits_cents),
+        func.count(),
+        literal(datetime.now(timezone.utc)),
+    ).group_by(legs.c.account_id, year, month)
+
+    await db.execute(delete(MonthlyAccountSummary))
+    await db.execute(
+        MonthlyAccountSummary.__table__.insert().from_select(
+            [
+                "account_id",
+                "year",
+                "month",
+                "credits_cents",
+                "debits_cents",
+                "transaction_count",
+                "updated_at",
+            ],
+            monthly_totals,
+        )
+    )
+    statement_service.invalidate_statement_cache()
+
+
+async def backfill_if_empty(db: AsyncSession) -> None:
+    """
+    Build the roll-up for a database that predates it.
+
+    A no-op once any summary row exists, or when there are no
+    transactions yet (the incremental path will populate it).
+    """
+    has_summary = await db.scalar(select(MonthlyAccountSummary.account_id).limit(1))
+    if has_summary is not None:
+        return
+
+    has_transactions = await db.scalar(select(Transaction.id).limit(1))
+    if has_transactions is None:
+        return
+
+    await rebuild_monthly_summaries(db)
@@ -3,6 +3,7 @@ Transaction service — the core financial business logic.
 
 THIS IS THE MOST CRITICAL FILE IN THE PROJECT. It handles:
   - Creating individual transactions (credits and debits)
+  - Creating a batch of transactions on one account in a single write
   - Executing atomic transfers between accounts
   - Balance enforcement (no negative balances)
   - Declined transaction audit trail
@@ -16,6 +17,10 @@ Atomicity:
   For transfers, both the debit (from source) and credit (to destination)
   happen in a single database transaction with begin_nested() (SAVEPOINT).
 
+  The monthly ledger roll-up (monthly_account_summaries) is maintained by
+  database triggers on the transactions table, so it is updated in the
+  same database transaction as each approved transaction it summarizes.
+
 Deadlock prevention:
   When a transfer involves two accounts, we always lock them in a
   consistent order (sorted by UUID). This prevents the classic deadlock
@@ -37,14 +42,22 @@ Admin read-only functions:
 """
 
 import uuid
+from collections.abc import Sequence
+from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.exceptions import AccountNotFoundError, InsufficientFundsError, UnauthorizedAccessError
+from app.exceptions import (
+    AccountNotFoundError,
+    InsufficientFundsError,
+    InvalidTransactionError,
+    UnauthorizedAccessError,
+)
 from app.models.account import Account
 from app.models.card import Card
 from app.models.transaction import Transaction
+from app.schemas.transaction import TransactionCreateRequest
 
 
 async def create_transaction(
@@ -55,7 +68,7 @@ async def create_transaction(
     amount_cents: int,
     description: str | None = None,
     card_id: uuid.UUID | None = None,
-) -> Transaction:
+) -> tuple[Transaction, int]:
     """
     Create a single credit or debit transaction.
 
@@ -84,7 +97,9 @@ async def create_transaction(
         card_id: Optional debit card used for this purchase.
 
     Returns:
-        The created Transaction instance.
+        Tuple of (transaction, new_balance_cents) — the account's cached
+        balance after this transaction, read from the row already locked
+        and updated here, so callers can report it without another query.
 
     Raises:
         AccountNotFoundError: If the account doesn't exist.
@@ -181,7 +196,95 @@ async def create_transaction(
 
     db.add(txn)
     await db.flush()
-    return txn
+    return txn, account.cached_balance_cents
+
+
+async def create_transactions_bulk(
+    db: AsyncSession,
+    account_id: uuid.UUID,
+    account_holder_id: uuid.UUID,
+    items: Sequence[TransactionCreateRequest],
+) -> list[Transaction]:
+    """
+    Create many credits and debits on one account in a single write.
+
+    Items are applied in list order against a running balance, with the
+    same rules as create_transaction(): credits are always approved, and a
+    debit the running balance can't cover is recorded as DECLINED. Unlike
+    the single-transaction path, a declined debit does not raise — the rest
+    of the batch still goes through, and callers read each row's status.
+
+    The database sees one locked account read, one multi-row
+    INSERT ... RETURNING for every ledger row (the roll-up triggers fire
+    per row inside it) and one balance update, all inside the caller's
+    transaction (get_db commits once per request). Rows are stamped a
+    microsecond apart from a single now(), so created_at order matches
+    list order.
+
+    Args:
+        db: Database session.
+        account_id: The account to credit/debit.
+        account_holder_id: The authenticated user's account holder ID
+                           (for ownership verification).
+        items: The transactions to create, in order (at least one).
+
+    Returns:
+        The created Transaction instances, in the same order as items.
+
+    Raises:
+        AccountNotFoundError: If the account doesn't exist.
+        UnauthorizedAccessError: If the account belongs to someone else.
+        InvalidTransactionError: If any item carries a card_id (card purchases
+                                 go through create_transaction one at a time).
+    """
+    # Verify ownership and lock the account row
+    result = await db.execute(
+        select(Account)
+        .where(Account.id == account_id)
+        .with_for_update()  # No-op on SQLite, locks row on PostgreSQL
+    )
+    account = result.scalar_one_or_none()
+
+    if account is None:
+        raise AccountNotFoundError(account_id)
+
+    if account.account_holder_id != account_holder_id:
+        raise UnauthorizedAccessError("You do not have access to this account")
+
+    if any(item.card_id is not None for item in items):
+        raise InvalidTransactionError("Card transactions cannot be created in bulk")
+
+    now = datetime.now(timezone.utc)
+    balance = account.cached_balance_cents
+    rows = []
+    for i, item in enumerate(items):
+        if item.type == "credit":
+            status = "approved"
+            balance += item.amount_cents
+        elif balance >= item.amount_cents:
+            status = "approved"
+            balance -= item.amount_cents
+        else:
+            status = "declined"
+
+        rows.append({
+            "id": uuid.uuid4(),
+            "type": item.type,
+            "amount_cents": item.amount_cents,
+            "from_account_id": None if item.type == "credit" else account_id,
+            "to_account_id": account_id if item.type == "credit" else None,
+            "status": status,
+            "description": item.description,
+            "created_at": now + timedelta(microseconds=i),
+            "updated_at": now,
+        })
+
+    result = await db.scalars(insert(Transaction).values(rows).returning(Transaction))
+    by_id = {txn.id: txn for txn in result}
+    txns = [by_id[row["id"]] for row in rows]
+
+    account.cached_balance_cents = balance
+    return txns
 
 
 async def create_transfer(
@@ -203,6 +306,10 @@ async def create_transfer(
     This ensures consistent lock ordering even when concurrent transfers
     happen between the same pair of accounts in opposite directions.
 
+    Both accounts are locked by a single SELECT ... FOR UPDATE, and both
+    legs are added together so the ORM writes them with one multi-row
+    INSERT (see test_transfer_writes_both_legs_in_one_insert).
+
     Args:
         db: Database session.
         from_account_id: Source account (must belong to the authenticated user).
@@ -221,28 +328,24 @@ async def create_transfer(
     """
     transfer_pair_id = uuid.uuid4()
 
-    # Lock accounts in consistent order (sorted by UUID) to prevent deadlocks
-    first_id, second_id = sorted([from_account_id, to_account_id])
-
-    first_result = await db.execute(
-        select(Account).where(Account.id == first_id).with_for_update()
-    )
-    first_account = first_result.scalar_one_or_none()
-
-    second_result = await db.execute(
-        select(Account).where(Account.id == second_id).with_for_update()
+    # Lock both accounts with one statement, in a consistent order (sorted
+    # by UUID) to prevent deadlocks: PostgreSQL locks rows as the ordered
+    # scan returns them
+    result = await db.execute(
+        select(Account)
+        .where(Account.id.in_([from_account_id, to_account_id]))
+        .order_by(Account.id)
+        .with_for_update()
     )
-    second_account = second_result.scalar_one_or_none()
+    accounts = {account.id: account for account in result.scalars()}
 
     # Verify both accounts exist
-    if first_account is None:
-        raise AccountNotFoundError(first_id)
-    if second_account is None:
-        raise AccountNotFoundError(second_id)
-
-    # Map back to source/destination
-    source = first_account if first_account.id == from_account_id else second_account
-    dest = second_account if second_account.id == to_account_id else first_account
+    for account_id in sorted([from_account_id, to_account_id]):
+        if account_id not in accounts:
+            raise AccountNotFoundError(account_id)
+
+    source = accounts[from_account_id]
+    dest = accounts[to_account_id]
 
     # Verify the authenticated user owns the SOURCE account
     if source.account_holder_id != account_holder_id:
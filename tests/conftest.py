@@ -3,15 +3,33 @@ Test fixtures for the Bank API test suite.
 
 This module provides shared fixtures used across all test files:
 
-  - db_engine / db_session: Fresh in-memory SQLite database for each test
+  - db_engine: The session's in-memory SQLite database (schema built once)
+  - db_connection: Per-test connection inside a transaction rolled back at teardown
+  - db_sessionmaker / db_session: Sessions joined to that per-test transaction
+  - app_get_db: The get_db override both test clients install (one request at a time)
   - client: Async HTTP test client (unauthenticated)
   - authenticated_client: Test client with a pre-registered MEMBER user and JWT
   - admin_client: Test client with a pre-registered ADMIN user and JWT
   - second_authenticated_client: A second MEMBER user for cross-user tests
+  - fresh_account: A new account owned by authenticated_client (its ID string)
+  - two_funded_accounts: Two accounts owned by authenticated_client, first one funded
+  - seed_txns: Inserts ledger rows for an account in one bulk write
+  - post_txns: Posts several transactions through the bulk endpoint
+  - frozen_now: Pins the server's ledger clock to FROZEN_NOW (mid-month)
+  - member_headers: Signs up additional members, returning their auth headers
+  - member_account: Signs up another member with an account (headers, account ID)
+  - txn_member: Another member's (headers, account ID), for admin tests
+  - account_with_card: An account with a card issued, IDs parsed to UUIDs
+  - count_queries: Records SQL statements issued against the test engine
 
 Key design decisions:
-  - In-memory SQLite (sqlite+aiosqlite://) is used for speed and isolation.
-    Each test gets a completely fresh database — no state leaks between tests.
+  - In-memory SQLite (sqlite+aiosqlite:///:memory: on a StaticPool) is used
+    for speed. The schema is created once per session; each test runs inside
+    one outer transaction that is rolled back at teardown, and every session
+    (test-side and app-side) joins it with SAVEPOINTs, so the app's commits
+    stay inside the test. Resetting state is a single ROLLBACK instead of
+    building and dropping every table (~12ms per test), and the engine's
+    compiled-SQL cache carries over between tests.
   - We override FastAPI's get_db dependency to inject our test session,
     so the application code works exactly as it does in production.
   - The authenticated_client fixture creates a user via the signup endpoint,
@@ -19,67 +37,432 @@ Key design decisions:
   - The admin_client fixture creates an admin by signing up normally and
     then directly updating user_type in the DB — this simulates the
     enterprise pattern where admins are provisioned by a system operator.
+  - The suite is safe to run in parallel with pytest-xdist (`-n auto`).
+    Each worker process has its own in-memory database and tests never
+    commit outside their rolled-back transaction, so workers need no
+    per-worker schema or files; the remaining process-global state
+    (app.dependency_overrides, the statement cache) is per worker process.
+  - Async tests run on uvloop (via the pytest_asyncio_loop_factories hook),
+    the same loop uvicorn[standard] uses in production. The HTTP client
+    stays per-test: ASGITransport calls the app in-process, so there are
+    no connections to reuse, and sharing one client across tests would
+    share its dependency overrides and default headers.
+  - Password hashing uses cheap Argon2 parameters for the whole session.
+    Production cost (64 MiB, 3 passes) is ~0.4s per hash, which made signup
+    and login dominate the suite. The user fixtures stay function-scoped:
+    each test's writes are rolled back and several fixtures share one
+    client, so sharing a signed-up user across tests would leak state.
 """
 
 import asyncio
+import contextlib
+import functools
+import itertools
 import uuid
+from datetime import datetime, timedelta, timezone
 
+import orjson
 import pytest
 import pytest_asyncio
-from httpx import AsyncClient, ASGITransport
-from sqlalchemy import select, update
+from httpx import AsyncClient, ASGITransport, Response
+from passlib.context import CryptContext
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import configure_mappers
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 
+from app import security
 from app.database import Base, get_db
 from app.exceptions import BankAPIError
 from app.main import app
+from app.models import Account, Card, Transaction
+from app.models import transaction as transaction_model
 from app.models.user import User, UserType
+from app.schemas.transaction import TransactionCreateRequest
+from app.services import statement_service, transaction_service
 
 
 # In-memory SQLite for fast, isolated tests
-TEST_DATABASE_URL = "sqlite+aiosqlite://"
+TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
+# The instant frozen_now pins the ledger clock to — mid-month and mid-day,
+# so no test can straddle a month boundary
+FROZEN_NOW = datetime(2026, 6, 15, 12, 0, tzinfo=timezone.utc)
 
-@pytest_asyncio.fixture
+
+def pytest_asyncio_loop_factories(config, item):
+    """
+    Run the async tests on uvloop, the loop uvicorn serves production on.
+
+    uvloop ships with uvicorn[standard] on Linux and macOS; where it is
+    unavailable (Windows) the stock asyncio loop is used instead.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
+# Minimum-cost Argon2id parameters — see _fast_password_hashing
+_FAST_ARGON2_SETTINGS = {
+    "schemes": ["argon2"],
+    "deprecated": "auto",
+    "argon2__memory_cost": 1024,
+    "argon2__time_cost": 1,
+    "argon2__parallelism": 1,
+}
+_FAST_ARGON2 = CryptContext(**_FAST_ARGON2_SETTINGS)
+
+
+@functools.cache
+def _memoized_hash(secret):
+    """Hash each distinct password once per session."""
+    return _FAST_ARGON2.hash(secret)
+
+
+class _MemoizedCryptContext(CryptContext):
+    """CryptContext whose hash() reuses the hash of a password already seen."""
+
+    def hash(self, secret, **kwds):
+        if kwds:
+            return super().hash(secret, **kwds)
+        return _memoized_hash(secret)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_password_hashing():
+    """
+    Swap in minimum-cost Argon2id parameters for the test session.
+
+    Hashes keep the same scheme and format ($argon2id$...), so signup,
+    login and verification run the real code paths — just without the
+    deliberate work factor that protects production passwords. Each
+    distinct password is also hashed only once per session (the suite
+    signs up hundreds of users with a handful of passwords); verification
+    still runs for real on every login.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            security,
+            "pwd_context",
+            _MemoizedCryptContext(**_FAST_ARGON2_SETTINGS),
+        )
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _orjson_response_decoding():
+    """
+    Decode test-client response bodies with orjson instead of stdlib json.
+
+    Tests call .json() on nearly every response, often several times. The
+    app's own responses are unaffected — FastAPI already serializes
+    response models straight to JSON bytes through Pydantic.
+    """
+    def json(self, **kwargs):
+        return orjson.loads(self.content)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Response, "json", json)
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_orm():
+    """
+    Pay SQLAlchemy's one-time ORM setup cost before the first test runs.
+
+    Mapper configuration (resolving relationships, building column maps)
+    happens lazily on first use and is process-global, so the first test
+    would otherwise absorb it. Compiling a SELECT/INSERT/UPDATE per model
+    also primes the per-mapper memoized state those statements rely on.
+    """
+    configure_mappers()
+    dialect = sqlite.dialect()
+    for model in (User, Account, Card, Transaction):
+        select(model).limit(0).compile(dialect=dialect)
+        insert(model).compile(dialect=dialect)
+        update(model).compile(dialect=dialect)
+
+
+@pytest_asyncio.fixture(scope="session")
 async def db_engine():
-    """Create a fresh async engine with all tables for each test."""
-    engine = create_async_engine(TEST_DATABASE_URL)
+    """Create the session's async engine and build the schema once.
+
+    StaticPool keeps a single connection for the engine's lifetime. An
+    in-memory SQLite database only exists on the connection that created
+    it, so every session (test-side and app-side) must share that one
+    connection — no disk I/O, no network.
+
+    The driver's own transaction handling is switched off and BEGIN is
+    emitted explicitly, which is what makes SAVEPOINTs (and so the
+    per-test rollback in db_connection) work on SQLite.
+    """
+    engine = create_async_engine(
+        TEST_DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _driver_autocommit(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _explicit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     yield engine
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
     await engine.dispose()
 
 
 @pytest_asyncio.fixture
-async def db_session(db_engine):
-    """Provide an async session bound to the test engine."""
-    async_session = async_sessionmaker(
-        db_engine,
+async def db_connection(db_engine):
+    """
+    The test's connection, inside a transaction rolled back at teardown.
+
+    Everything the test and the app write — including their commits, which
+    only release SAVEPOINTs (see db_sessionmaker) — disappears with the
+    rollback, leaving the schema empty for the next test.
+    """
+    async with db_engine.connect() as conn:
+        transaction = await conn.begin()
+        yield conn
+        await transaction.rollback()
+
+
+@pytest.fixture
+def db_sessionmaker(db_connection):
+    """Session factory bound to the test's connection and transaction."""
+    return async_sessionmaker(
+        bind=db_connection,
         class_=AsyncSession,
         expire_on_commit=False,
+        join_transaction_mode="create_savepoint",
     )
-    async with async_session() as session:
+
+
+_TRANSACTION_CONTROL = ("BEGIN", "SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+
+@contextlib.contextmanager
+def _count_queries(engine):
+    """Collect every SQL statement the engine sends to the driver."""
+    queries: list[str] = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        # The per-test transaction's own BEGIN/SAVEPOINT traffic isn't app SQL
+        if not statement.startswith(_TRANSACTION_CONTROL):
+            queries.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield queries
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+@pytest.fixture
+def count_queries(db_engine):
+    """
+    Context manager factory that records the SQL issued inside its block.
+
+    Guards hot endpoints against N+1 regressions:
+
+        with count_queries() as queries:
+            await authenticated_client.post(...)
+        assert len(queries) <= 6
+    """
+    return lambda: _count_queries(db_engine.sync_engine)
+
+
+@pytest_asyncio.fixture
+async def db_session(db_sessionmaker):
+    """Provide an async session inside the test's transaction."""
+    async with db_sessionmaker() as session:
         yield session
 
 
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """
+    Pin the server-side clock that stamps transactions and classifies months.
+
+    Without this, a test that posts a transaction and then asks for "this
+    month's" statement can straddle a month boundary and fail. Patches the
+    `datetime` used by the Transaction model's created_at/updated_at
+    defaults, by transaction_service (bulk stamping) and by
+    statement_service (closed-month checks), so the
+    ledger and the test agree on the month. Each now() call advances one
+    millisecond from FROZEN_NOW, keeping insertion order = time order.
+
+    Other clocks (JWT expiry, account timestamps) are left alone. Returns
+    FROZEN_NOW for tests to build their year/month parameters from.
+    """
+    ticks = itertools.count()
+
+    class _PinnedDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            instant = FROZEN_NOW + timedelta(milliseconds=next(ticks))
+            return instant.astimezone(tz) if tz else instant.replace(tzinfo=None)
+
+    monkeypatch.setattr(transaction_model, "datetime", _PinnedDatetime)
+    monkeypatch.setattr(transaction_service, "datetime", _PinnedDatetime)
+    monkeypatch.setattr(statement_service, "datetime", _PinnedDatetime)
+    return FROZEN_NOW
+
+
 @pytest_asyncio.fixture
-async def client(db_engine):
+async def two_funded_accounts(authenticated_client, seed_txns):
     """
-    Async HTTP test client with the test database injected.
+    Async factory for the transfer tests' usual starting point.
 
-    This overrides the get_db dependency so all requests hit the
-    in-memory test database instead of the real one.
+        source_id, dest_id = await two_funded_accounts(fund_a=10000)
+
+    Opens two accounts for authenticated_client and, unless fund_a is 0,
+    seeds the first with a credit of fund_a cents. Returns the two account
+    ID strings.
     """
-    async_session = async_sessionmaker(
-        db_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+    async def make(fund_a=10000):
+        acct_a, acct_b = await asyncio.gather(
+            authenticated_client.post("/accounts", json={}),
+            authenticated_client.post("/accounts", json={}),
+        )
+        account_a_id, account_b_id = acct_a.json()["id"], acct_b.json()["id"]
+        if fund_a:
+            await seed_txns(account_a_id, [{"type": "credit", "amount_cents": fund_a}])
+        return account_a_id, account_b_id
+
+    return make
+
+
+@pytest_asyncio.fixture
+async def seed_txns(db_session):
+    """
+    Async helper that inserts transactions for one account in bulk.
+
+        await seed_txns(account_id, [
+            {"type": "credit", "amount_cents": 10000},
+            {"type": "debit", "amount_cents": 9999, "status": "declined"},
+        ])
+
+    Each spec needs "type" and "amount_cents"; "description" is optional.
+
+    Plain specs go through transaction_service.create_transactions_bulk —
+    one multi-row INSERT and a single commit, skipping the HTTP layer, with
+    statuses decided by the real balance rules. A spec may also pin
+    "status" or "created_at" (backdated history, forced declines); such
+    batches are written directly with one executemany INSERT, stamped a
+    millisecond apart from the ledger clock's now where created_at is
+    missing, and the account's cached balance is brought in line so
+    balances agree with the ledger (the roll-up triggers keep statements
+    in line on their own).
+
+    Use this to set up state; keep at least one test per behaviour on the
+    real endpoint. Returns the new transaction IDs in order.
+    """
+    async def seed(account_id, specs):
+        account_id = uuid.UUID(str(account_id))
+        if not any("status" in spec or "created_at" in spec for spec in specs):
+            account_holder_id = await db_session.scalar(
+                select(Account.account_holder_id).where(Account.id == account_id)
+            )
+            txns = await transaction_service.create_transactions_bulk(
+                db_session,
+                account_id,
+                account_holder_id,
+                [TransactionCreateRequest(**spec) for spec in specs],
+            )
+            await db_session.commit()
+            return [txn.id for txn in txns]
+
+        # Same clock the model stamps rows with (pinned under frozen_now)
+        now = transaction_model.datetime.now(timezone.utc)
+        rows = []
+        net_cents = 0
+        for i, spec in enumerate(specs):
+            is_credit = spec["type"] == "credit"
+            status = spec.get("status", "approved")
+            rows.append({
+                "id": uuid.uuid4(),
+                "type": spec["type"],
+                "amount_cents": spec["amount_cents"],
+                "from_account_id": None if is_credit else account_id,
+                "to_account_id": account_id if is_credit else None,
+                "status": status,
+                "description": spec.get("description"),
+                "created_at": spec.get("created_at", now + timedelta(milliseconds=i)),
+                "updated_at": now,
+            })
+            if status == "approved":
+                net_cents += spec["amount_cents"] if is_credit else -spec["amount_cents"]
+
+        await db_session.execute(insert(Transaction), rows)
+        await db_session.execute(
+            update(Account)
+            .where(Account.id == account_id)
+            .values(cached_balance_cents=Account.cached_balance_cents + net_cents)
+        )
+        await db_session.commit()
+        # Backdated rows rewrite history the closed-month cache assumes is final
+        statement_service.invalidate_statement_cache()
+        return [row["id"] for row in rows]
+
+    return seed
+
+
+@pytest.fixture
+def post_txns():
+    """
+    Async helper that posts several transactions in one request.
+
+        response = await post_txns(authenticated_client, account_id, [
+            {"type": "credit", "amount_cents": 10000},
+            {"type": "debit", "amount_cents": 2500},
+        ])
+
+    Goes through the real POST /accounts/{id}/transactions:bulk endpoint —
+    one round trip and one commit instead of one per transaction. Returns
+    the response; items are applied in order, and a debit the balance
+    can't cover comes back declined rather than failing the request.
+    """
+    async def post(client, account_id, txns):
+        return await client.post(
+            f"/accounts/{account_id}/transactions:bulk",
+            json={"transactions": txns},
+        )
+
+    return post
+
+
+@pytest.fixture
+def app_get_db(db_sessionmaker):
+    """
+    The get_db override every test client installs on the app.
+
+    Request sessions come from db_sessionmaker, so all requests hit the
+    in-memory test database inside the test's transaction. Every session
+    shares the test's single connection, so two requests in flight at once
+    (asyncio.gather) would otherwise share one SQLite transaction: one
+    request's commit would commit the other's half-done work, or fail
+    outright if it lands while the other is still reading an
+    INSERT ... RETURNING. Each request session therefore holds a lock for
+    its lifetime, and gathered requests run one after another — the suite
+    checks that the results are correct whatever order requests finish in,
+    not that the app survives real races between them.
+
+    Function-scoped and shared by client and second_authenticated_client,
+    so both clients' requests take the same lock.
+    """
+    connection_lock = asyncio.Lock()
 
     async def override_get_db():
-        async with async_session() as session:
+        async with connection_lock, db_sessionmaker() as session:
             try:
                 yield session
                 await session.commit()
@@ -92,7 +475,20 @@ async def client(db_engine):
                 await session.rollback()
                 raise
 
-    app.dependency_overrides[get_db] = override_get_db
+    return override_get_db
+
+
+@pytest_asyncio.fixture
+async def client(app_get_db):
+    """
+    Async HTTP test client with the test database injected.
+
+    This overrides the get_db dependency (see app_get_db) so all requests
+    hit the in-memory test database instead of the real one. Requests are
+    dispatched to the ASGI app in-process (httpx.ASGITransport) — there is
+    no server, socket or loopback TCP.
+    """
+    app.dependency_overrides[get_db] = app_get_db
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -127,7 +523,99 @@ async def authenticated_client(client):
 
 
 @pytest_asyncio.fixture
-async def admin_client(client, db_engine):
+async def member_headers(client):
+    """
+    Async factory that signs up another member and returns their auth headers.
+
+        headers = await member_headers("someone@example.com", "Some", "One")
+        await client.post("/accounts", json={}, headers=headers)
+
+    For tests that need several users on one client. Function-scoped like
+    the other user fixtures: each test's writes are rolled back, so a user
+    signed up once per class or session would not exist in the next test.
+    """
+    async def signup(email, first_name="Test", last_name="Member"):
+        response = await client.post(
+            "/auth/signup",
+            json={
+                "email": email,
+                "password": "StrongPass99!",
+                "first_name": first_name,
+                "last_name": last_name,
+            },
+        )
+        assert response.status_code == 201, f"Signup failed: {response.text}"
+        return {"Authorization": f"Bearer {response.json()['token']}"}
+
+    return signup
+
+
+@pytest_asyncio.fixture
+async def member_account(client, member_headers):
+    """
+    Async factory that signs up another member and opens an account for them.
+
+        headers, account_id = await member_account("someone@example.com", "Some", "One")
+
+    A non-zero deposit_cents funds the account in the same request. Returns
+    (auth headers, account ID string).
+    """
+    async def open_account(email, first_name="Test", last_name="Member", deposit_cents=0):
+        headers = await member_headers(email, first_name, last_name)
+        account = await client.post(
+            "/accounts", json={"initial_deposit_cents": deposit_cents}, headers=headers
+        )
+        assert account.status_code == 201, f"Account creation failed: {account.text}"
+        return headers, account.json()["id"]
+
+    return open_account
+
+
+@pytest_asyncio.fixture
+async def txn_member(member_account):
+    """
+    A member other than the admin, with one empty account.
+
+    Returns (auth headers, account ID string). Used by admin tests that need
+    someone else's ledger to look at; the signup's password hash is memoized,
+    so only the first use in a run pays for it.
+    """
+    return await member_account("txn_member@example.com", "Txn", "Member")
+
+
+@pytest_asyncio.fixture
+async def fresh_account(authenticated_client):
+    """
+    A new, empty account owned by authenticated_client.
+
+    Returns the account ID as the string the API responds with, ready to
+    interpolate into URLs.
+    """
+    response = await authenticated_client.post("/accounts", json={})
+    assert response.status_code == 201, f"Account creation failed: {response.text}"
+    return response.json()["id"]
+
+
+@pytest_asyncio.fixture
+async def account_with_card(authenticated_client):
+    """
+    An account owned by authenticated_client with a card issued on it.
+
+    Returns (account_id, card_id, card): the IDs are already parsed to
+    uuid.UUID so tests can hand them straight to db_session.get(), and
+    card is the issuance response body.
+    """
+    account = await authenticated_client.post("/accounts", json={})
+    account_id = account.json()["id"]
+
+    response = await authenticated_client.post(f"/accounts/{account_id}/card")
+    assert response.status_code == 201, f"Card issuance failed: {response.text}"
+    card = response.json()
+    return uuid.UUID(account_id), uuid.UUID(card["id"]), card
+
+
+@pytest_asyncio.fixture
+async def admin_client(client, db_sessionmaker):
     """
     Test client with a pre-registered ADMIN user and JWT token.
 
@@ -153,10 +641,7 @@ async def admin_client(client, db_engine):
     user_id = uuid.UUID(signup_response.json()["user_id"])
 
     # Promote to admin directly in the database
-    async_session = async_sessionmaker(
-        db_engine, class_=AsyncSession, expire_on_commit=False,
-    )
-    async with async_session() as session:
+    async with db_sessionmaker() as session:
         await session.execute(
             update(User)
             .where(User.id == user_id)
@@ -164,8 +649,7 @@ async def admin_client(client, db_engine):
         )
         await session.commit()
 
-    # Log in again to get a fresh token (user_type doesn't affect JWT payload,
-    # but this ensures the test flow is realistic)
+    # Log in again so the token's "role" claim reflects the promotion
     login_response = await client.post(
         "/auth/login",
         json={"email": "admin@example.com", "password": "AdminPass123!"},
@@ -176,32 +660,17 @@ async def admin_client(client, db_engine):
 
 
 @pytest_asyncio.fixture
-async def second_authenticated_client(db_engine):
+async def second_authenticated_client(app_get_db):
     """
     A second authenticated MEMBER user for cross-user authorization tests.
 
     This fixture creates its OWN httpx.AsyncClient (separate from the
     primary `client` fixture) so that both `authenticated_client` and
     `second_authenticated_client` can be used in the same test without
-    overwriting each other's Authorization headers.
+    overwriting each other's Authorization headers. Both clients go
+    through the same get_db override (app_get_db).
     """
-    async_session = async_sessionmaker(
-        db_engine, class_=AsyncSession, expire_on_commit=False,
-    )
-
-    async def override_get_db():
-        async with async_session() as session:
-            try:
-                yield session
-                await session.commit()
-            except BankAPIError:
-                await session.commit()
-                raise
-            except Exception:
-                await session.rollback()
-                raise
-
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_db] = app_get_db
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
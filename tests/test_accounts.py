@@ -4,6 +4,7 @@ Tests for account management endpoints and role-based access control.
 These tests verify:
   - Members can create, list, and view their own accounts
   - Members CANNOT access another user's accounts (403)
+  - Several balances can be read in one request, in the order requested
   - Admins can view ALL accounts and balances (read-only)
   - Admins CANNOT access member banking endpoints (403)
   - New accounts start with zero balance
@@ -59,6 +60,32 @@ class TestAccountCreation:
         )
         assert response.status_code == 422
 
+    async def test_create_with_initial_deposit(self, authenticated_client):
+        """An opening deposit funds the account and is recorded as a credit."""
+        response = await authenticated_client.post(
+            "/accounts",
+            json={"initial_deposit_cents": 20000},
+        )
+        assert response.status_code == 201
+        account = response.json()
+        assert account["cached_balance_cents"] == 20000
+
+        txns = await authenticated_client.get(f"/accounts/{account['id']}/transactions")
+        assert [(t["type"], t["amount_cents"], t["status"]) for t in txns.json()] == [
+            ("credit", 20000, "approved")
+        ]
+
+        balance = await authenticated_client.get(f"/accounts/{account['id']}/balance")
+        assert balance.json()["match"] is True
+
+    async def test_create_negative_initial_deposit(self, authenticated_client):
+        """A negative opening deposit should be rejected (422)."""
+        response = await authenticated_client.post(
+            "/accounts",
+            json={"initial_deposit_cents": -1},
+        )
+        assert response.status_code == 422
+
     async def test_create_multiple_accounts(self, authenticated_client):
         """A member can create multiple accounts."""
         await authenticated_client.post("/accounts", json={"account_type": "checking"})
@@ -82,6 +109,62 @@ class TestAccountCreation:
         assert data["computed_balance_cents"] == 0
         assert data["match"] is True
 
+    async def test_balance_without_recompute(
+        self, authenticated_client, fresh_account, count_queries
+    ):
+        """compute=false returns the cached balance without summing transactions."""
+        await authenticated_client.post(
+            f"/accounts/{fresh_account}/transactions",
+            json={"type": "credit", "amount_cents": 4200},
+        )
+
+        with count_queries() as queries:
+            response = await authenticated_client.get(
+                f"/accounts/{fresh_account}/balance?compute=false"
+            )
+        assert response.status_code == 200
+        data = response.json()
+        assert data["cached_balance_cents"] == 4200
+        assert data["computed_balance_cents"] is None
+        assert data["match"] is None
+        assert not any("FROM transactions" in q for q in queries)
+
+    async def test_bulk_balances_in_requested_order(
+        self, authenticated_client, seed_txns, count_queries
+    ):
+        """Several balances come back in one request, in the order asked for."""
+        acct_a = await authenticated_client.post("/accounts", json={})
+        acct_b = await authenticated_client.post("/accounts", json={})
+        acct_c = await authenticated_client.post("/accounts", json={})
+        a, b, c = (acct.json()["id"] for acct in (acct_a, acct_b, acct_c))
+        await seed_txns(a, [{"type": "credit", "amount_cents": 3000}])
+        await seed_txns(b, [
+            {"type": "credit", "amount_cents": 9000},
+            {"type": "debit", "amount_cents": 1500},
+        ])
+
+        with count_queries() as queries:
+            response = await authenticated_client.get(
+                f"/accounts/balances?ids={b}&ids={c}&ids={a}"
+            )
+        assert response.status_code == 200
+        balances = response.json()
+        assert [bal["account_id"] for bal in balances] == [b, c, a]
+        assert [bal["cached_balance_cents"] for bal in balances] == [7500, 0, 3000]
+        assert [bal["computed_balance_cents"] for bal in balances] == [7500, 0, 3000]
+        assert all(bal["match"] is True for bal in balances)
+        # One account load and one grouped SUM, however many accounts
+        assert sum("FROM transactions" in q for q in queries) == 1
+
+    async def test_bulk_balances_missing_account_is_404(
+        self, authenticated_client, fresh_account
+    ):
+        """Any unknown account in the list fails the whole request."""
+        response = await authenticated_client.get(
+            f"/accounts/balances?ids={fresh_account}&ids={uuid.uuid4()}"
+        )
+        assert response.status_code == 404
+
 
 # ---------------------------------------------------------------------------
 # Member: Account Retrieval
@@ -197,6 +280,18 @@ class TestOwnershipEnforcement:
         )
         assert response.status_code == 403
 
+    async def test_cannot_view_other_users_balance_in_bulk(
+        self, authenticated_client, second_authenticated_client
+    ):
+        """Mixing in another user's account fails the bulk balance read (403)."""
+        own = await second_authenticated_client.post("/accounts", json={})
+        other = await authenticated_client.post("/accounts", json={})
+
+        response = await second_authenticated_client.get(
+            f"/accounts/balances?ids={own.json()['id']}&ids={other.json()['id']}"
+        )
+        assert response.status_code == 403
+
     async def test_list_only_shows_own_accounts(self, client):
         """GET /accounts should only return the current user's accounts."""
         # Sign up User A and create 2 accounts
@@ -10,8 +10,11 @@ These tests verify:
   - Short passwords are rejected (422 Validation Error)
   - Empty/missing fields are rejected
   - Profile updates cannot modify email (security boundary)
+  - A cached token is still rejected once it expires
 """
 
+import time
+
 import pytest
 
 
@@ -250,6 +253,17 @@ class TestTokenValidation:
         )
         assert response.status_code == 401
 
+    async def test_cached_token_rejected_after_expiry(self, authenticated_client, monkeypatch):
+        """A token verified earlier must still be rejected once it expires."""
+        response = await authenticated_client.get("/account-holders/me")
+        assert response.status_code == 200
+
+        # Jump past the token lifetime; the signature check is now a cache hit
+        a_day_later = time.time() + 24 * 60 * 60
+        monkeypatch.setattr("app.security.time.time", lambda: a_day_later)
+        response = await authenticated_client.get("/account-holders/me")
+        assert response.status_code == 401
+
 
 # ---------------------------------------------------------------------------
 # Profile Security Tests
@@ -15,7 +15,6 @@ These tests verify:
 import uuid
 
 import pytest
-from sqlalchemy import select
 
 from app.models.card import Card
 from app.security import decrypt_value
@@ -104,20 +103,12 @@ class TestCardRetrieval:
 class TestCardEncryption:
     """Tests that card data is encrypted at rest in the database."""
 
-    async def test_card_number_encrypted_in_db(self, authenticated_client, db_session):
+    async def test_card_number_encrypted_in_db(self, account_with_card, db_session):
         """The full card number stored in DB should be encrypted, not plaintext."""
-        account = await authenticated_client.post("/accounts", json={})
-        account_id = account.json()["id"]
+        _, card_id, card_data = account_with_card
 
-        card_response = await authenticated_client.post(f"/accounts/{account_id}/card")
-        card_id = card_response.json()["id"]
-        last_four = card_response.json()["card_number_last_four"]
-
-        # Read the card directly from the database
-        result = await db_session.execute(
-            select(Card).where(Card.id == uuid.UUID(card_id))
-        )
-        card = result.scalar_one()
+        # Read the card directly from the database (primary-key lookup)
+        card = await db_session.get(Card, card_id)
 
         # The encrypted field should NOT be readable as a plain card number
         assert isinstance(card.card_number_encrypted, bytes)
@@ -128,20 +119,13 @@ class TestCardEncryption:
         decrypted = decrypt_value(raw_bytes)
         assert len(decrypted) == 16
         assert decrypted.isdigit()
-        assert decrypted[-4:] == last_four
+        assert decrypted[-4:] == card_data["card_number_last_four"]
 
-    async def test_cvv_encrypted_in_db(self, authenticated_client, db_session):
+    async def test_cvv_encrypted_in_db(self, account_with_card, db_session):
         """The CVV stored in DB should be encrypted, not plaintext."""
-        account = await authenticated_client.post("/accounts", json={})
-        account_id = account.json()["id"]
+        _, card_id, _ = account_with_card
 
-        card_response = await authenticated_client.post(f"/accounts/{account_id}/card")
-        card_id = card_response.json()["id"]
-
-        result = await db_session.execute(
-            select(Card).where(Card.id == uuid.UUID(card_id))
-        )
-        card = result.scalar_one()
+        card = await db_session.get(Card, card_id)
 
         assert isinstance(card.cvv_encrypted, bytes)
         decrypted = decrypt_value(card.cvv_encrypted)
@@ -157,7 +141,7 @@ class TestDebitCardPurchase:
     records which card was used.
     """
 
-    async def test_purchase_with_card(self, authenticated_client):
+    async def test_purchase_with_card(self, authenticated_client, count_queries):
         """A debit with card_id should record the card on the transaction."""
         account = await authenticated_client.post("/accounts", json={})
         account_id = account.json()["id"]
@@ -173,16 +157,20 @@ class TestDebitCardPurchase:
         card_id = card.json()["id"]
 
         # Make a purchase with the card
-        response = await authenticated_client.post(
-            f"/accounts/{account_id}/transactions",
-            json={
-                "type": "debit",
-                "amount_cents": 3000,
-                "description": "Coffee shop",
-                "card_id": card_id,
-            },
-        )
+        with count_queries() as queries:
+            response = await authenticated_client.post(
+                f"/accounts/{account_id}/transactions",
+                json={
+                    "type": "debit",
+                    "amount_cents": 3000,
+                    "description": "Coffee shop",
+                    "card_id": card_id,
+                },
+            )
         assert response.status_code == 201
+        # user + account holder (auth), account, card, balance UPDATE,
+        # txn INSERT (the monthly roll-up is a trigger on that INSERT)
+        assert len(queries) <= 6, queries
         txn = response.json()
         assert txn["card_id"] == card_id
         assert txn["status"] == "approved"
@@ -300,8 +288,9 @@ class TestDebitCardPurchase:
         txns = await authenticated_client.get(
             f"/accounts/{account_id}/transactions?status=declined"
         )
-        assert len(txns.json()) == 1
-        assert txns.json()[0]["card_id"] == card_id
+        declined = txns.json()
+        assert len(declined) == 1
+        assert declined[0]["card_id"] == card_id
 
 
 class TestCardOwnership:
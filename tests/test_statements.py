@@ -3,28 +3,46 @@ Tests for monthly statement endpoints.
 
 These tests verify:
   - Statements include aggregates (opening/closing balance, totals)
-  - Statements include the full list of transactions for the month
-  - Opening balance is computed from prior months' transactions
+  - Statements include the month's transactions, streamed in batches and
+    paginated with a keyset cursor
+  - The month's transaction list is served by the (account, created_at) indexes
+  - Opening balance is computed from prior months' transactions (including
+    backdated rows inserted with the seed_txns fixture)
   - Declined transactions are included in the list but not in balance totals
   - Empty months produce a valid statement with zero activity
+  - The monthly ledger roll-up tracks approved activity (including status
+    changes, via database triggers) and can be rebuilt
+  - Closed months are cached; the current month is always regenerated
   - Ownership enforcement
   - Admin is blocked from statement endpoints
 """
 
 import uuid
-from datetime import datetime, timezone
-from unittest.mock import patch
+from datetime import datetime, timedelta, timezone
 
 import pytest
+from sqlalchemy import event, select, update
+
+from app.config import settings
+from app.exceptions import UnauthorizedAccessError
+from app.models.account import Account
+from app.models.monthly_account_summary import MonthlyAccountSummary
+from app.models.transaction import Transaction
+from app.services import statement_service, summary_service
+
+# Every test here runs against the pinned ledger clock (see conftest.frozen_now),
+# so test-side and server-side "now" always fall in the same month.
+pytestmark = pytest.mark.usefixtures("frozen_now")
 
 
 class TestStatementGeneration:
     """Tests for GET /accounts/{id}/statements?year=&month=."""
 
-    async def test_statement_with_transactions(self, authenticated_client):
+    async def test_statement_with_transactions(
+        self, authenticated_client, fresh_account, frozen_now
+    ):
         """Statement should include aggregates and all transactions."""
-        account = await authenticated_client.post("/accounts", json={})
-        account_id = account.json()["id"]
+        account_id = fresh_account
 
         # Create some transactions
         await authenticated_client.post(
@@ -40,7 +58,7 @@ class TestStatementGeneration:
             json={"type": "debit", "amount_cents": 3000, "description": "Groceries"},
         )
 
-        now = datetime.now(timezone.utc)
+        now = frozen_now
         response = await authenticated_client.get(
             f"/accounts/{account_id}/statements",
             params={"year": now.year, "month": now.month},
@@ -61,16 +79,105 @@ class TestStatementGeneration:
         # Full transaction list
         assert len(data["transactions"]) == 3
 
-    async def test_empty_month_statement(self, authenticated_client):
-        """Statement for a month with no transactions should have zero activity."""
-        account = await authenticated_client.post("/accounts", json={})
-        account_id = account.json()["id"]
-
+    async def test_statement_month_scan_uses_account_time_indexes(
+        self, authenticated_client, fresh_account, seed_txns, db_engine, db_connection, frozen_now
+    ):
+        """The month's transaction list should be an index range read, not a table scan."""
+        account_id = fresh_account
+        await seed_txns(account_id, [{"type": "credit", "amount_cents": 10000}])
+
+        # Capture the list query exactly as the service sends it
+        captured = []
+
+        def _capture(conn, cursor, statement, parameters, context, executemany):
+            if "ORDER BY transactions.created_at" in statement:
+                captured.append((statement, parameters))
+
+        now = frozen_now
+        event.listen(db_engine.sync_engine, "before_cursor_execute", _capture)
+        try:
+            response = await authenticated_client.get(
+                f"/accounts/{account_id}/statements",
+                params={"year": now.year, "month": now.month},
+            )
+        finally:
+            event.remove(db_engine.sync_engine, "before_cursor_execute", _capture)
+        assert response.status_code == 200
+        assert len(captured) == 1
+
+        statement, parameters = captured[0]
+        plan = await db_connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        details = [row[3] for row in plan]
+
+        assert not any(d.startswith("SCAN transactions") for d in details)
+        assert any("ix_transactions_from_account_created_at" in d for d in details)
+        assert any("ix_transactions_to_account_created_at" in d for d in details)
+
+    async def test_statement_streams_list_in_batches(
+        self, authenticated_client, fresh_account, seed_txns, monkeypatch, frozen_now
+    ):
+        """A list longer than one stream batch should arrive complete and in order."""
+        monkeypatch.setattr(statement_service, "STREAM_BATCH_SIZE", 2)
+        account_id = fresh_account
+        await seed_txns(account_id, [
+            {"type": "credit", "amount_cents": 100 * (i + 1), "description": f"Txn {i}"}
+            for i in range(5)
+        ])
+
+        now = frozen_now
         response = await authenticated_client.get(
             f"/accounts/{account_id}/statements",
-            params={"year": 2025, "month": 1},
+            params={"year": now.year, "month": now.month},
         )
         assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+
+        assert data["transaction_count"] == 5
+        assert data["total_credits_cents"] == 1500
+        assert [t["description"] for t in data["transactions"]] == [
+            f"Txn {i}" for i in range(5)
+        ]
+
+    async def test_streamed_rows_match_transaction_schema(
+        self, authenticated_client, fresh_account, frozen_now
+    ):
+        """Statement rows should serialize exactly like TransactionResponse elsewhere."""
+        account_id = fresh_account
+        await authenticated_client.post(
+            f"/accounts/{account_id}/transactions",
+            json={"type": "credit", "amount_cents": 4000, "description": "Deposit"},
+        )
+        await authenticated_client.post(
+            f"/accounts/{account_id}/transactions",
+            json={"type": "debit", "amount_cents": 1500},
+        )
+
+        now = frozen_now
+        statement = await authenticated_client.get(
+            f"/accounts/{account_id}/statements",
+            params={"year": now.year, "month": now.month},
+        )
+        listing = await authenticated_client.get(f"/accounts/{account_id}/transactions")
+
+        # The list endpoint is newest first; statements are oldest first
+        assert statement.json()["transactions"] == listing.json()[::-1]
+
+    async def test_empty_month_statement(
+        self, authenticated_client, fresh_account, count_queries
+    ):
+        """Statement for a month with no transactions should have zero activity."""
+        account_id = fresh_account
+
+        with count_queries() as queries:
+            response = await authenticated_client.get(
+                f"/accounts/{account_id}/statements",
+                params={"year": 2025, "month": 1},
+            )
+        assert response.status_code == 200
+
+        # The aggregate's zero count short-circuits the transaction list query
+        assert not any("ORDER BY transactions.created_at" in q for q in queries)
         data = response.json()
 
         assert data["opening_balance_cents"] == 0
@@ -80,23 +187,19 @@ class TestStatementGeneration:
         assert data["transaction_count"] == 0
         assert data["transactions"] == []
 
-    async def test_statement_includes_declined_in_list_not_totals(self, authenticated_client):
+    async def test_statement_includes_declined_in_list_not_totals(
+        self, authenticated_client, fresh_account, seed_txns, frozen_now
+    ):
         """Declined transactions appear in the list but don't affect balances."""
-        account = await authenticated_client.post("/accounts", json={})
-        account_id = account.json()["id"]
+        account_id = fresh_account
 
-        # Deposit $50
-        await authenticated_client.post(
-            f"/accounts/{account_id}/transactions",
-            json={"type": "credit", "amount_cents": 5000},
-        )
-        # Try to withdraw $100 (will be declined)
-        await authenticated_client.post(
-            f"/accounts/{account_id}/transactions",
-            json={"type": "debit", "amount_cents": 10000},
-        )
+        # Deposit $50, then a $100 withdrawal that was declined
+        await seed_txns(account_id, [
+            {"type": "credit", "amount_cents": 5000},
+            {"type": "debit", "amount_cents": 10000, "status": "declined"},
+        ])
 
-        now = datetime.now(timezone.utc)
+        now = frozen_now
         response = await authenticated_client.get(
             f"/accounts/{account_id}/statements",
             params={"year": now.year, "month": now.month},
@@ -113,38 +216,119 @@ class TestStatementGeneration:
         assert data["total_credits_cents"] == 5000
         assert data["total_debits_cents"] == 0  # Declined debit excluded
 
-    async def test_statement_transactions_ordered_chronologically(self, authenticated_client):
+    async def test_statement_transactions_ordered_chronologically(
+        self, authenticated_client, fresh_account, seed_txns, frozen_now
+    ):
         """Transactions in a statement should be ordered oldest to newest."""
-        account = await authenticated_client.post("/accounts", json={})
-        account_id = account.json()["id"]
-
-        await authenticated_client.post(
-            f"/accounts/{account_id}/transactions",
-            json={"type": "credit", "amount_cents": 1000, "description": "First"},
-        )
-        await authenticated_client.post(
-            f"/accounts/{account_id}/transactions",
-            json={"type": "credit", "amount_cents": 2000, "description": "Second"},
-        )
-        await authenticated_client.post(
-            f"/accounts/{account_id}/transactions",
-            json={"type": "credit", "amount_cents": 3000, "description": "Third"},
-        )
+        account_id = fresh_account
+
+        # Seeded out of insertion order to prove the list is sorted by time
+        now = frozen_now
+        await seed_txns(account_id, [
+            {"type": "credit", "amount_cents": 3000, "description": "Third",
+             "created_at": now - timedelta(seconds=1)},
+            {"type": "credit", "amount_cents": 1000, "description": "First",
+             "created_at": now - timedelta(seconds=3)},
+            {"type": "credit", "amount_cents": 2000, "description": "Second",
+             "created_at": now - timedelta(seconds=2)},
+        ])
 
-        now = datetime.now(timezone.utc)
         response = await authenticated_client.get(
             f"/accounts/{account_id}/statements",
-            params={"year": now.year, "month": now.month},
+            params={"year": now.year, "month": now.month, "size": 3},
         )
         data = response.json()
 
+        # The whole month fits on one page of 3
         descriptions = [t["description"] for t in data["transactions"]]
         assert descriptions == ["First", "Second", "Third"]
+        assert data["next_cursor"] is None
+
+    async def test_statement_paginates_with_cursor(
+        self, authenticated_client, fresh_account, seed_txns, frozen_now
+    ):
+        """Pages follow next_cursor to the end; aggregates always cover the whole month."""
+        account_id = fresh_account
+        await seed_txns(account_id, [
+            {"type": "credit", "amount_cents": 100, "description": f"Txn {i}"}
+            for i in range(5)
+        ])
+
+        pages = []
+        params = {"year": frozen_now.year, "month": frozen_now.month, "size": 2}
+        while True:
+            response = await authenticated_client.get(
+                f"/accounts/{account_id}/statements", params=params
+            )
+            assert response.status_code == 200
+            data = response.json()
+            assert data["transaction_count"] == 5
+            assert data["total_credits_cents"] == 500
+            pages.append([t["description"] for t in data["transactions"]])
+            if data["next_cursor"] is None:
+                break
+            params["after_id"] = data["next_cursor"]
+
+        assert pages == [["Txn 0", "Txn 1"], ["Txn 2", "Txn 3"], ["Txn 4"]]
+
+    async def test_pagination_breaks_timestamp_ties_by_id(
+        self, authenticated_client, fresh_account, seed_txns, frozen_now
+    ):
+        """Rows sharing a created_at are split across pages without gaps or repeats."""
+        account_id = fresh_account
+        same_instant = frozen_now - timedelta(hours=1)
+        seeded = await seed_txns(account_id, [
+            {"type": "credit", "amount_cents": 100, "created_at": same_instant}
+            for _ in range(4)
+        ])
+
+        params = {"year": frozen_now.year, "month": frozen_now.month, "size": 3}
+        first = (await authenticated_client.get(
+            f"/accounts/{account_id}/statements", params=params
+        )).json()
+        params["after_id"] = first["next_cursor"]
+        second = (await authenticated_client.get(
+            f"/accounts/{account_id}/statements", params=params
+        )).json()
+
+        ids = [t["id"] for t in first["transactions"] + second["transactions"]]
+        assert ids == sorted(str(txn_id) for txn_id in seeded)
+        assert second["next_cursor"] is None
+
+    @pytest.mark.parametrize("cursor", ["other_account", "unknown"])
+    async def test_cursor_outside_statement_rejected(
+        self, authenticated_client, two_funded_accounts, seed_txns, frozen_now, cursor
+    ):
+        """A cursor must be one of this statement's own transactions."""
+        account_id, other_account_id = await two_funded_accounts()
+        [other_txn_id] = await seed_txns(
+            other_account_id, [{"type": "credit", "amount_cents": 100}]
+        )
+        after_id = other_txn_id if cursor == "other_account" else uuid.uuid4()
 
-    async def test_missing_year_or_month_rejected(self, authenticated_client):
+        response = await authenticated_client.get(
+            f"/accounts/{account_id}/statements",
+            params={
+                "year": frozen_now.year,
+                "month": frozen_now.month,
+                "after_id": str(after_id),
+            },
+        )
+        assert response.status_code == 422
+        assert response.json()["error_type"] == "invalid_cursor"
+
+    async def test_page_size_is_bounded(self, authenticated_client, fresh_account, frozen_now):
+        """Page size must be between 1 and 1000."""
+        for size in (0, 1001):
+            response = await authenticated_client.get(
+                f"/accounts/{fresh_account}/statements",
+                params={"year": frozen_now.year, "month": frozen_now.month, "size": size},
+            )
+            assert response.status_code == 422
+
+    async def test_missing_year_or_month_rejected(self, authenticated_client, fresh_account):
         """Year and month query params are required."""
-        account = await authenticated_client.post("/accounts", json={})
-        account_id = account.json()["id"]
+        account_id = fresh_account
 
         # Missing both
         response = await authenticated_client.get(
@@ -158,10 +342,9 @@ class TestStatementGeneration:
         )
         assert response.status_code == 422
 
-    async def test_invalid_month_rejected(self, authenticated_client):
+    async def test_invalid_month_rejected(self, authenticated_client, fresh_account):
         """Month must be 1-12."""
-        account = await authenticated_client.post("/accounts", json={})
-        account_id = account.json()["id"]
+        account_id = fresh_account
 
         response = await authenticated_client.get(
             f"/accounts/{account_id}/statements",
@@ -179,7 +362,7 @@ class TestStatementGeneration:
 class TestStatementOpeningBalance:
     """Tests that opening balance is correctly computed from prior months."""
 
-    async def test_opening_balance_reflects_prior_activity(self, authenticated_client):
+    async def test_opening_balance_reflects_prior_activity(self, authenticated_client, frozen_now):
         """Opening balance should include all approved transactions before the month.
 
         Since all test transactions happen in the current month, we verify
@@ -199,7 +382,7 @@ class TestStatementOpeningBalance:
             json={"type": "debit", "amount_cents": 5000},
         )
 
-        now = datetime.now(timezone.utc)
+        now = frozen_now
         response = await authenticated_client.get(
             f"/accounts/{account_id}/statements",
             params={"year": now.year, "month": now.month},
@@ -222,6 +405,289 @@ class TestStatementOpeningBalance:
         assert data["closing_balance_cents"] == 15000  # No new activity
         assert data["transaction_count"] == 0
 
+    async def test_opening_balance_includes_backdated_months(
+        self, authenticated_client, fresh_account, seed_txns
+    ):
+        """Activity seeded into earlier months should carry into the opening balance."""
+        account_id = fresh_account
+        await seed_txns(account_id, [
+            {"type": "credit", "amount_cents": 50000,
+             "created_at": datetime(2025, 1, 15, tzinfo=timezone.utc)},
+            {"type": "debit", "amount_cents": 20000,
+             "created_at": datetime(2025, 2, 10, tzinfo=timezone.utc)},
+            {"type": "debit", "amount_cents": 90000, "status": "declined",
+             "created_at": datetime(2025, 2, 11, tzinfo=timezone.utc)},
+            {"type": "credit", "amount_cents": 7500,
+             "created_at": datetime(2025, 3, 1, tzinfo=timezone.utc)},
+        ])
+
+        response = await authenticated_client.get(
+            f"/accounts/{account_id}/statements",
+            params={"year": 2025, "month": 3},
+        )
+        data = response.json()
+
+        assert data["opening_balance_cents"] == 30000  # 50000 - 20000, declined ignored
+        assert data["total_credits_cents"] == 7500
+        assert data["closing_balance_cents"] == 37500
+        assert data["transaction_count"] == 1
+
+        # The seeded ledger and the cached balance agree
+        balance = (await authenticated_client.get(f"/accounts/{account_id}/balance")).json()
+        assert balance["cached_balance_cents"] == balance["computed_balance_cents"] == 37500
+
+
+class TestMonthlySummary:
+    """Tests for the monthly_account_summaries roll-up behind opening balances."""
+
+    @staticmethod
+    async def _summary_rows(db_session, account_id):
+        result = await db_session.execute(
+            select(MonthlyAccountSummary)
+            .where(MonthlyAccountSummary.account_id == uuid.UUID(account_id))
+            .execution_options(populate_existing=True)
+        )
+        return [
+            (r.year, r.month, r.credits_cents, r.debits_cents, r.transaction_count)
+            for r in result.scalars().all()
+        ]
+
+    async def test_summary_tracks_approved_activity(
+        self, authenticated_client, db_session, frozen_now
+    ):
+        """Approved credits/debits roll up into the month's row; declines don't."""
+        account = await authenticated_client.post("/accounts", json={})
+        account_id = account.json()["id"]
+
+        await authenticated_client.post(
+            f"/accounts/{account_id}/transactions",
+            json={"type": "credit", "amount_cents": 10000},
+        )
+        await authenticated_client.post(
+            f"/accounts/{account_id}/transactions",
+            json={"type": "debit", "amount_cents": 3000},
+        )
+        # Declined — must not appear in the roll-up
+        await authenticated_client.post(
+            f"/accounts/{account_id}/transactions",
+            json={"type": "debit", "amount_cents": 50000},
+        )
+
+        now = frozen_now
+        rows = await self._summary_rows(db_session, account_id)
+        assert rows == [(now.year, now.month, 10000, 3000, 2)]
+
+    async def test_transfer_updates_both_accounts(
+        self, authenticated_client, db_session, frozen_now
+    ):
+        """Each transfer leg is summarized against its own account."""
+        acct_a = await authenticated_client.post("/accounts", json={})
+        acct_b = await authenticated_client.post("/accounts", json={})
+        account_a_id = acct_a.json()["id"]
+        account_b_id = acct_b.json()["id"]
+
+        await authenticated_client.post(
+            f"/accounts/{account_a_id}/transactions",
+            json={"type": "credit", "amount_cents": 10000},
+        )
+        await authenticated_client.post(
+            "/transfers",
+            json={
+                "from_account_id": account_a_id,
+                "to_account_id": account_b_id,
+                "amount_cents": 4000,
+            },
+        )
+
+        now = frozen_now
+        assert await self._summary_rows(db_session, account_a_id) == [
+            (now.year, now.month, 10000, 4000, 2)
+        ]
+        assert await self._summary_rows(db_session, account_b_id) == [
+            (now.year, now.month, 4000, 0, 1)
+        ]
+
+    async def test_rebuild_matches_incremental(self, authenticated_client, db_session):
+        """A full rebuild from transactions reproduces the incremental roll-up."""
+        account = await authenticated_client.post("/accounts", json={})
+        account_id = account.json()["id"]
+
+        for txn in (
+            {"type": "credit", "amount_cents": 7000},
+            {"type": "debit", "amount_cents": 2500},
+            {"type": "credit", "amount_cents": 1234},
+        ):
+            await authenticated_client.post(
+                f"/accounts/{account_id}/transactions", json=txn
+            )
+
+        incremental = await self._summary_rows(db_session, account_id)
+
+        await summary_service.rebuild_monthly_summaries(db_session)
+        await db_session.commit()
+
+        assert await self._summary_rows(db_session, account_id) == incremental
+
+    async def test_status_changes_adjust_summary(
+        self, fresh_account, seed_txns, db_session, frozen_now
+    ):
+        """The roll-up triggers follow a row into and out of "approved"."""
+        [txn_id] = await seed_txns(fresh_account, [
+            {"type": "credit", "amount_cents": 6000, "status": "pending"},
+        ])
+        assert await self._summary_rows(db_session, fresh_account) == []
+
+        async def set_status(status):
+            await db_session.execute(
+                update(Transaction).where(Transaction.id == txn_id).values(status=status)
+            )
+            await db_session.commit()
+
+        now = frozen_now
+        await set_status("approved")
+        assert await self._summary_rows(db_session, fresh_account) == [
+            (now.year, now.month, 6000, 0, 1)
+        ]
+
+        await set_status("declined")
+        assert await self._summary_rows(db_session, fresh_account) == [
+            (now.year, now.month, 0, 0, 0)
+        ]
+
+
+def _previous_month(now: datetime) -> tuple[int, int]:
+    """(year, month) of the last closed calendar month before `now`."""
+    if now.month == 1:
+        return now.year - 1, 12
+    return now.year, now.month - 1
+
+
+class TestStatementCache:
+    """Tests for the closed-month statement cache."""
+
+    async def test_closed_month_served_from_cache(
+        self, authenticated_client, count_queries, frozen_now
+    ):
+        """A repeat fetch of a closed month should skip the statement queries."""
+        account = await authenticated_client.post("/accounts", json={})
+        account_id = account.json()["id"]
+        year, month = _previous_month(frozen_now)
+        params = {"year": year, "month": month}
+
+        with count_queries() as first_queries:
+            first = await authenticated_client.get(
+                f"/accounts/{account_id}/statements", params=params
+            )
+        with count_queries() as second_queries:
+            second = await authenticated_client.get(
+                f"/accounts/{account_id}/statements", params=params
+            )
+
+        assert first.status_code == 200
+        assert second.status_code == 200
+        assert second.json() == first.json()
+        # The cache hit still checks ownership, but never reads the ledger
+        assert any("FROM transactions" in q for q in first_queries)
+        assert not any("FROM transactions" in q for q in second_queries)
+
+    async def test_only_default_first_page_cached(
+        self, authenticated_client, count_queries, frozen_now
+    ):
+        """Custom page sizes and later pages are generated fresh every time."""
+        account = await authenticated_client.post("/accounts", json={})
+        account_id = account.json()["id"]
+        year, month = _previous_month(frozen_now)
+        params = {"year": year, "month": month, "size": 2}
+
+        await authenticated_client.get(f"/accounts/{account_id}/statements", params=params)
+        with count_queries() as second_queries:
+            await authenticated_client.get(
+                f"/accounts/{account_id}/statements", params=params
+            )
+
+        assert any("FROM transactions" in q for q in second_queries)
+        assert (uuid.UUID(account_id), year, month) not in statement_service._closed_statements
+
+    async def test_month_inside_grace_period_not_cached(
+        self, authenticated_client, count_queries, frozen_now, monkeypatch
+    ):
+        """A month that ended too recently may still receive late writes."""
+        # frozen_now is mid-month, so a 30-day grace still covers last month
+        monkeypatch.setattr(settings, "STATEMENT_CACHE_GRACE_SECONDS", 30 * 24 * 3600)
+        account = await authenticated_client.post("/accounts", json={})
+        account_id = account.json()["id"]
+        year, month = _previous_month(frozen_now)
+        params = {"year": year, "month": month}
+
+        await authenticated_client.get(f"/accounts/{account_id}/statements", params=params)
+        with count_queries() as second_queries:
+            await authenticated_client.get(
+                f"/accounts/{account_id}/statements", params=params
+            )
+
+        assert any("FROM transactions" in q for q in second_queries)
+
+    async def test_current_month_not_cached(self, authenticated_client, frozen_now):
+        """The current month must reflect new activity on every fetch."""
+        account = await authenticated_client.post("/accounts", json={})
+        account_id = account.json()["id"]
+        now = frozen_now
+        params = {"year": now.year, "month": now.month}
+
+        before = await authenticated_client.get(
+            f"/accounts/{account_id}/statements", params=params
+        )
+        await authenticated_client.post(
+            f"/accounts/{account_id}/transactions",
+            json={"type": "credit", "amount_cents": 2500},
+        )
+        after = await authenticated_client.get(
+            f"/accounts/{account_id}/statements", params=params
+        )
+
+        assert before.json()["transaction_count"] == 0
+        assert after.json()["transaction_count"] == 1
+        assert after.json()["closing_balance_cents"] == 2500
+
+    async def test_cached_statement_still_checks_ownership(
+        self, authenticated_client, second_authenticated_client, frozen_now
+    ):
+        """A cache hit must not bypass the ownership check."""
+        account = await authenticated_client.post("/accounts", json={})
+        account_id = account.json()["id"]
+        year, month = _previous_month(frozen_now)
+        params = {"year": year, "month": month}
+
+        owner = await authenticated_client.get(
+            f"/accounts/{account_id}/statements", params=params
+        )
+        assert owner.status_code == 200
+
+        other = await second_authenticated_client.get(
+            f"/accounts/{account_id}/statements", params=params
+        )
+        assert other.status_code == 403
+
+    async def test_rebuild_invalidates_cache(
+        self, authenticated_client, db_session, count_queries, frozen_now
+    ):
+        """Rebuilding the roll-up should force closed months to be regenerated."""
+        account = await authenticated_client.post("/accounts", json={})
+        account_id = account.json()["id"]
+        year, month = _previous_month(frozen_now)
+        params = {"year": year, "month": month}
+
+        with count_queries() as miss_queries:
+            await authenticated_client.get(f"/accounts/{account_id}/statements", params=params)
+
+        await summary_service.rebuild_monthly_summaries(db_session)
+        await db_session.commit()
+
+        with count_queries() as after_rebuild_queries:
+            await authenticated_client.get(f"/accounts/{account_id}/statements", params=params)
+
+        assert len(after_rebuild_queries) == len(miss_queries)
+
 
 class TestStatementOwnership:
     """Tests that users can only access their own statements."""
@@ -259,6 +725,35 @@ class TestStatementOwnership:
         )
         assert response.status_code == 403
 
+    async def test_statement_for_missing_account_is_404(self, authenticated_client):
+        """An unknown account ID should be 404, not 403."""
+        response = await authenticated_client.get(
+            f"/accounts/{uuid.uuid4()}/statements",
+            params={"year": 2026, "month": 1},
+        )
+        assert response.status_code == 404
+
+    async def test_ownership_checked_in_aggregate_query(
+        self, authenticated_client, fresh_account, db_session, count_queries, frozen_now
+    ):
+        """Uncached statements should verify ownership without a query of its own."""
+        account_id = uuid.UUID(fresh_account)
+        holder_id = await db_session.scalar(
+            select(Account.account_holder_id).where(Account.id == account_id)
+        )
+
+        with count_queries() as queries:
+            await statement_service.stream_statement_json(
+                db_session, account_id, holder_id, frozen_now.year, frozen_now.month
+            )
+        assert len(queries) == 1
+
+        with count_queries() as queries, pytest.raises(UnauthorizedAccessError):
+            await statement_service.stream_statement_json(
+                db_session, account_id, uuid.uuid4(), frozen_now.year, frozen_now.month
+            )
+        assert len(queries) == 1
+
 
 class TestAdminBlockedFromStatements:
     """Tests that admins cannot access statement endpoints."""
@@ -271,3 +766,13 @@ class TestAdminBlockedFromStatements:
             params={"year": 2026, "month": 1},
         )
         assert response.status_code == 403
+
+    async def test_admin_rejected_without_database_work(self, admin_client, count_queries):
+        """The admin block should come from the token alone, before any query."""
+        with count_queries() as queries:
+            response = await admin_client.get(
+                f"/accounts/{uuid.uuid4()}/statements",
+                params={"year": 2026, "month": 1},
+            )
+        assert response.status_code == 403
+        assert queries == []
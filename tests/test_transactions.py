@@ -7,23 +7,24 @@ These tests verify:
   - Purchases are DECLINED when insufficient balance
   - Declined transactions are still recorded (audit trail)
   - Transaction listing and filtering works
+  - The generated signed amount follows the transaction type
+  - Bulk creation applies items in order in a single INSERT
   - Admin can view all transactions org-wide
-  - Concurrent transactions from different account holders
+  - Gathered transactions from different account holders (serialized by the harness)
 """
 
 import asyncio
 import uuid
 
-import pytest
+from app.models.transaction import Transaction
 
 
 class TestDeposit:
     """Tests for credit (deposit) transactions."""
 
-    async def test_deposit_increases_balance(self, authenticated_client):
+    async def test_deposit_increases_balance(self, authenticated_client, fresh_account):
         """A credit transaction should increase the account balance."""
-        account = await authenticated_client.post("/accounts", json={})
-        account_id = account.json()["id"]
+        account_id = fresh_account
 
         txn_response = await authenticated_client.post(
             f"/accounts/{account_id}/transactions",
@@ -36,35 +37,37 @@ class TestDeposit:
         assert txn["status"] == "approved"
         assert txn["to_account_id"] == account_id
         assert txn["from_account_id"] is None
+        assert txn["new_balance_cents"] == 10000
 
-        balance = await authenticated_client.get(f"/accounts/{account_id}/balance")
-        assert balance.json()["cached_balance_cents"] == 10000
-
-    async def test_multiple_deposits_accumulate(self, authenticated_client):
-        """Multiple deposits should accumulate correctly."""
-        account = await authenticated_client.post("/accounts", json={})
-        account_id = account.json()["id"]
+    async def test_multiple_deposits_accumulate(self, authenticated_client, fresh_account):
+        """Multiple deposits should accumulate correctly, whichever lands first."""
+        account_id = fresh_account
 
-        await authenticated_client.post(
-            f"/accounts/{account_id}/transactions",
-            json={"type": "credit", "amount_cents": 5000},
-        )
-        await authenticated_client.post(
-            f"/accounts/{account_id}/transactions",
-            json={"type": "credit", "amount_cents": 3000},
+        # Credits commute, so the total can't depend on completion order
+        results = await asyncio.gather(
+            authenticated_client.post(
+                f"/accounts/{account_id}/transactions",
+                json={"type": "credit", "amount_cents": 5000},
+            ),
+            authenticated_client.post(
+                f"/accounts/{account_id}/transactions",
+                json={"type": "credit", "amount_cents": 3000},
+            ),
         )
+        assert [r.status_code for r in results] == [201, 201]
 
         balance = await authenticated_client.get(f"/accounts/{account_id}/balance")
-        assert balance.json()["cached_balance_cents"] == 8000
+        data = balance.json()
+        assert data["cached_balance_cents"] == 8000
+        assert data["match"] is True
 
 
 class TestPurchase:
     """Tests for debit (purchase/withdrawal) transactions."""
 
-    async def test_purchase_decreases_balance(self, authenticated_client):
+    async def test_purchase_decreases_balance(self, authenticated_client, fresh_account):
         """A debit transaction should decrease the account balance."""
-        account = await authenticated_client.post("/accounts", json={})
-        account_id = account.json()["id"]
+        account_id = fresh_account
 
         await authenticated_client.post(
             f"/accounts/{account_id}/transactions",
@@ -81,14 +84,13 @@ class TestPurchase:
         assert txn["status"] == "approved"
         assert txn["from_account_id"] == account_id
         assert txn["to_account_id"] is None
+        assert txn["new_balance_cents"] == 7000
 
-        balance = await authenticated_client.get(f"/accounts/{account_id}/balance")
-        assert balance.json()["cached_balance_cents"] == 7000
-
-    async def test_purchase_rejected_insufficient_balance(self, authenticated_client):
+    async def test_purchase_rejected_insufficient_balance(
+        self, authenticated_client, fresh_account
+    ):
         """A debit exceeding the balance should be declined (422)."""
-        account = await authenticated_client.post("/accounts", json={})
-        account_id = account.json()["id"]
+        account_id = fresh_account
 
         await authenticated_client.post(
             f"/accounts/{account_id}/transactions",
@@ -104,13 +106,9 @@ class TestPurchase:
         assert response.json()["requested_cents"] == 10000
         assert response.json()["available_cents"] == 5000
 
-        balance = await authenticated_client.get(f"/accounts/{account_id}/balance")
-        assert balance.json()["cached_balance_cents"] == 5000
-
-    async def test_declined_transaction_recorded(self, authenticated_client):
+    async def test_declined_transaction_recorded(self, authenticated_client, fresh_account):
         """A declined debit should still appear in the transaction list."""
-        account = await authenticated_client.post("/accounts", json={})
-        account_id = account.json()["id"]
+        account_id = fresh_account
 
         await authenticated_client.post(
             f"/accounts/{account_id}/transactions",
@@ -126,10 +124,9 @@ class TestPurchase:
         assert declined[0]["status"] == "declined"
         assert declined[0]["amount_cents"] == 1000
 
-    async def test_exact_balance_debit_succeeds(self, authenticated_client):
+    async def test_exact_balance_debit_succeeds(self, authenticated_client, fresh_account):
         """Debiting the exact balance should succeed (leaving zero)."""
-        account = await authenticated_client.post("/accounts", json={})
-        account_id = account.json()["id"]
+        account_id = fresh_account
 
         await authenticated_client.post(
             f"/accounts/{account_id}/transactions",
@@ -141,14 +138,11 @@ class TestPurchase:
         )
         assert response.status_code == 201
         assert response.json()["status"] == "approved"
+        assert response.json()["new_balance_cents"] == 0
 
-        balance = await authenticated_client.get(f"/accounts/{account_id}/balance")
-        assert balance.json()["cached_balance_cents"] == 0
-
-    async def test_zero_amount_rejected(self, authenticated_client):
+    async def test_zero_amount_rejected(self, authenticated_client, fresh_account):
         """Zero-amount transactions should be rejected (422)."""
-        account = await authenticated_client.post("/accounts", json={})
-        account_id = account.json()["id"]
+        account_id = fresh_account
 
         response = await authenticated_client.post(
             f"/accounts/{account_id}/transactions",
@@ -156,10 +150,9 @@ class TestPurchase:
         )
         assert response.status_code == 422
 
-    async def test_negative_amount_rejected(self, authenticated_client):
+    async def test_negative_amount_rejected(self, authenticated_client, fresh_account):
         """Negative amounts should be rejected (422)."""
-        account = await authenticated_client.post("/accounts", json={})
-        account_id = account.json()["id"]
+        account_id = fresh_account
 
         response = await authenticated_client.post(
             f"/accounts/{account_id}/transactions",
@@ -171,10 +164,9 @@ class TestPurchase:
 class TestTransactionListing:
     """Tests for GET /accounts/{id}/transactions."""
 
-    async def test_list_transactions(self, authenticated_client):
+    async def test_list_transactions(self, authenticated_client, fresh_account):
         """Should return all transactions for an account."""
-        account = await authenticated_client.post("/accounts", json={})
-        account_id = account.json()["id"]
+        account_id = fresh_account
 
         await authenticated_client.post(
             f"/accounts/{account_id}/transactions",
@@ -191,10 +183,9 @@ class TestTransactionListing:
         assert response.status_code == 200
         assert len(response.json()) == 2
 
-    async def test_filter_by_type(self, authenticated_client):
+    async def test_filter_by_type(self, authenticated_client, fresh_account):
         """Should be able to filter transactions by type."""
-        account = await authenticated_client.post("/accounts", json={})
-        account_id = account.json()["id"]
+        account_id = fresh_account
 
         await authenticated_client.post(
             f"/accounts/{account_id}/transactions",
@@ -211,10 +202,9 @@ class TestTransactionListing:
         assert len(credits.json()) == 1
         assert credits.json()[0]["type"] == "credit"
 
-    async def test_get_single_transaction(self, authenticated_client):
+    async def test_get_single_transaction(self, authenticated_client, fresh_account):
         """Should be able to get a single transaction by ID."""
-        account = await authenticated_client.post("/accounts", json={})
-        account_id = account.json()["id"]
+        account_id = fresh_account
 
         txn = await authenticated_client.post(
             f"/accounts/{account_id}/transactions",
@@ -232,79 +222,141 @@ class TestTransactionListing:
 class TestBalanceIntegrity:
     """Tests that cached balance matches computed balance."""
 
-    async def test_balance_match_after_multiple_transactions(self, authenticated_client):
+    async def test_balance_match_after_multiple_transactions(
+        self, authenticated_client, post_txns, fresh_account
+    ):
         """Cached and computed balances should match after many operations."""
-        account = await authenticated_client.post("/accounts", json={})
-        account_id = account.json()["id"]
+        account_id = fresh_account
+
+        response = await post_txns(authenticated_client, account_id, [
+            {"type": "credit", "amount_cents": 10000},
+            {"type": "debit", "amount_cents": 2500},
+            {"type": "credit", "amount_cents": 3333},
+            {"type": "debit", "amount_cents": 1111},
+        ])
+        assert response.status_code == 201
+        assert [t["status"] for t in response.json()] == ["approved"] * 4
 
-        await authenticated_client.post(
-            f"/accounts/{account_id}/transactions",
-            json={"type": "credit", "amount_cents": 10000},
-        )
-        await authenticated_client.post(
+        balance = await authenticated_client.get(f"/accounts/{account_id}/balance")
+        data = balance.json()
+        # 10000 - 2500 + 3333 - 1111 = 9722
+        assert data["cached_balance_cents"] == 9722
+        assert data["computed_balance_cents"] == 9722
+        assert data["match"] is True
+
+    async def test_signed_amount_generated_from_type(
+        self, authenticated_client, db_session, fresh_account
+    ):
+        """The DB-generated signed_amount_cents should be +credit / -debit."""
+        account_id = fresh_account
+
+        credit = await authenticated_client.post(
             f"/accounts/{account_id}/transactions",
-            json={"type": "debit", "amount_cents": 2500},
+            json={"type": "credit", "amount_cents": 4200},
         )
-        await authenticated_client.post(
+        debit = await authenticated_client.post(
             f"/accounts/{account_id}/transactions",
-            json={"type": "credit", "amount_cents": 3333},
-        )
-        await authenticated_client.post(
-            f"/accounts/{account_id}/transactions",
-            json={"type": "debit", "amount_cents": 1111},
+            json={"type": "debit", "amount_cents": 1700},
         )
 
-        balance = await authenticated_client.get(f"/accounts/{account_id}/balance")
+        credit_row = await db_session.get(Transaction, uuid.UUID(credit.json()["id"]))
+        debit_row = await db_session.get(Transaction, uuid.UUID(debit.json()["id"]))
+        assert credit_row.signed_amount_cents == 4200
+        assert debit_row.signed_amount_cents == -1700
+
+
+class TestBulkTransactions:
+    """Tests for bulk creation (the service via seed_txns, and the endpoint)."""
+
+    async def test_bulk_applies_items_in_order(
+        self, authenticated_client, fresh_account, seed_txns, db_session
+    ):
+        """A debit the running balance can't cover is declined, not raised."""
+        ids = await seed_txns(fresh_account, [
+            {"type": "credit", "amount_cents": 5000},
+            {"type": "debit", "amount_cents": 2000},
+            {"type": "debit", "amount_cents": 4000},
+            {"type": "debit", "amount_cents": 3000},
+        ])
+
+        rows = [await db_session.get(Transaction, txn_id) for txn_id in ids]
+        assert [r.status for r in rows] == ["approved", "approved", "declined", "approved"]
+        assert [r.created_at for r in rows] == sorted(r.created_at for r in rows)
+
+        balance = await authenticated_client.get(f"/accounts/{fresh_account}/balance")
         data = balance.json()
-        # 10000 - 2500 + 3333 - 1111 = 9722
-        assert data["cached_balance_cents"] == 9722
-        assert data["computed_balance_cents"] == 9722
+        assert data["cached_balance_cents"] == 0
+        assert data["computed_balance_cents"] == 0
         assert data["match"] is True
 
+    async def test_bulk_issues_one_insert(self, fresh_account, seed_txns, count_queries):
+        """Every ledger row should go in with a single INSERT statement."""
+        with count_queries() as queries:
+            await seed_txns(fresh_account, [
+                {"type": "credit", "amount_cents": 100} for _ in range(50)
+            ])
+
+        inserts = [q for q in queries if q.startswith("INSERT INTO transactions")]
+        assert len(inserts) == 1
+
+    async def test_bulk_endpoint_enforces_ownership(
+        self, client, member_headers, member_account, post_txns
+    ):
+        """Bulk posting to someone else's account should be 403 and write nothing."""
+        owner_headers, account_id = await member_account("bulk_owner@example.com", "Bulk", "Owner")
+        client.headers.update(await member_headers("bulk_other@example.com"))
+
+        response = await post_txns(client, account_id, [
+            {"type": "credit", "amount_cents": 100},
+        ])
+        assert response.status_code == 403
 
-class TestConcurrentTransactions:
-    """Tests for concurrent transactions from different account holders.
+        listing = await client.get(
+            f"/accounts/{account_id}/transactions", headers=owner_headers
+        )
+        assert listing.json() == []
+
+    async def test_bulk_endpoint_rejects_card_purchases(
+        self, authenticated_client, fresh_account, post_txns
+    ):
+        """Card purchases must go through the single-transaction endpoint."""
+        response = await post_txns(authenticated_client, fresh_account, [
+            {"type": "debit", "amount_cents": 100, "card_id": str(uuid.uuid4())},
+        ])
+        assert response.status_code == 400
+        assert response.json()["error_type"] == "invalid_transaction"
+
+    async def test_bulk_card_purchase_on_other_users_account_is_forbidden(
+        self, client, member_headers, member_account, post_txns
+    ):
+        """Ownership is checked before the card rule, as on the single endpoint."""
+        _, account_id = await member_account("bulk_card_owner@example.com", "Card", "Owner")
+        client.headers.update(await member_headers("bulk_card_other@example.com"))
+
+        response = await post_txns(client, account_id, [
+            {"type": "debit", "amount_cents": 100, "card_id": str(uuid.uuid4())},
+        ])
+        assert response.status_code == 403
 
-    These tests verify that when multiple users make transactions at the
-    same time, each user's balance is correctly updated and no data
-    corruption occurs.
 
-    Note: SQLite serializes writes, so true parallelism isn't possible.
-    However, these tests verify the correctness of the concurrent-safe
-    patterns (ordered locking, atomic updates) that will matter when
-    migrating to PostgreSQL.
+class TestConcurrentTransactions:
+    """Tests for gathered transactions from different account holders.
+
+    These tests fire several requests together with asyncio.gather and
+    check that every balance comes out right whatever order they finish
+    in. The test harness serializes requests (see app_get_db in conftest),
+    so they never overlap inside the database: the tests check the
+    outcome, not race safety. Row locking for truly concurrent requests
+    is PostgreSQL's job and isn't exercised here.
     """
 
-    async def test_concurrent_deposits_to_different_accounts(self, client):
+    async def test_concurrent_deposits_to_different_accounts(self, client, member_account):
         """Multiple users depositing to their own accounts concurrently."""
         # Create two users with accounts
-        signup_a = await client.post(
-            "/auth/signup",
-            json={
-                "email": "concurrent_a@example.com",
-                "password": "StrongPass99!",
-                "first_name": "User",
-                "last_name": "A",
-            },
-        )
-        token_a = signup_a.json()["token"]
-        headers_a = {"Authorization": f"Bearer {token_a}"}
-        acct_a = await client.post("/accounts", json={}, headers=headers_a)
-        account_a_id = acct_a.json()["id"]
-
-        signup_b = await client.post(
-            "/auth/signup",
-            json={
-                "email": "concurrent_b@example.com",
-                "password": "StrongPass99!",
-                "first_name": "User",
-                "last_name": "B",
-            },
-        )
-        token_b = signup_b.json()["token"]
-        headers_b = {"Authorization": f"Bearer {token_b}"}
-        acct_b = await client.post("/accounts", json={}, headers=headers_b)
-        account_b_id = acct_b.json()["id"]
+        (headers_a, account_a_id), (headers_b, account_b_id) = await asyncio.gather(
+            member_account("concurrent_a@example.com", "User", "A"),
+            member_account("concurrent_b@example.com", "User", "B"),
+        )
 
         # Fire concurrent deposits
         results = await asyncio.gather(
@@ -325,92 +377,50 @@ class TestConcurrentTransactions:
 
         # Verify balances are correct
         bal_a = await client.get(
-            f"/accounts/{account_a_id}/balance", headers=headers_a
+            f"/accounts/{account_a_id}/balance?compute=false", headers=headers_a
         )
         bal_b = await client.get(
-            f"/accounts/{account_b_id}/balance", headers=headers_b
+            f"/accounts/{account_b_id}/balance?compute=false", headers=headers_b
         )
         assert bal_a.json()["cached_balance_cents"] == 5000
         assert bal_b.json()["cached_balance_cents"] == 7000
 
     async def test_concurrent_debits_same_account(self, authenticated_client):
-        """Multiple debits to the same account should maintain consistency.
-
-        If account has $100 and two $60 debits fire concurrently:
-          - On PostgreSQL (with row-level locking): one succeeds, one is declined
-          - On SQLite (no row-level locking): both may succeed since each
-            request gets its own session and SQLite serializes writes
+        """Two debits that together overdraw an account must not both go through.
 
-        This test verifies that the balance is never negative regardless
-        of the database backend.
+        The account holds $100 and two $60 debits are gathered, so at most
+        one can be approved and the other must come back declined. The test
+        client runs requests one at a time (see app_get_db), so this checks
+        the balance rule under either completion order — it does not open a
+        race window between the balance check and the write.
         """
-        account = await authenticated_client.post("/accounts", json={})
-        account_id = account.json()["id"]
-
-        # Deposit $100
-        await authenticated_client.post(
-            f"/accounts/{account_id}/transactions",
-            json={"type": "credit", "amount_cents": 10000},
+        # Open the account with $100
+        account = await authenticated_client.post(
+            "/accounts", json={"initial_deposit_cents": 10000}
         )
+        account_id = account.json()["id"]
 
-        # Fire two $60 debits concurrently
-        results = await asyncio.gather(
-            authenticated_client.post(
-                f"/accounts/{account_id}/transactions",
-                json={"type": "debit", "amount_cents": 6000},
-            ),
+        # Fire two $60 debits together
+        results = await asyncio.gather(*(
             authenticated_client.post(
                 f"/accounts/{account_id}/transactions",
                 json={"type": "debit", "amount_cents": 6000},
-            ),
-        )
+            )
+            for _ in range(2)
+        ))
 
-        status_codes = sorted([r.status_code for r in results])
-        # Both may succeed on SQLite (no row-level locking); on PostgreSQL
-        # one would succeed and one would be declined.
-        assert all(code in (201, 422) for code in status_codes)
+        assert sorted(r.status_code for r in results) == [201, 422]
 
         # The critical invariant: balance must never be negative
-        balance = await authenticated_client.get(f"/accounts/{account_id}/balance")
+        balance = await authenticated_client.get(f"/accounts/{account_id}/balance?compute=false")
         assert balance.json()["cached_balance_cents"] >= 0
 
-    async def test_concurrent_mixed_operations(self, client):
+    async def test_concurrent_mixed_operations(self, client, member_account):
         """Different users performing different operations simultaneously."""
-        # User A: depositing
-        signup_a = await client.post(
-            "/auth/signup",
-            json={
-                "email": "mix_a@example.com",
-                "password": "StrongPass99!",
-                "first_name": "Mix",
-                "last_name": "A",
-            },
-        )
-        token_a = signup_a.json()["token"]
-        headers_a = {"Authorization": f"Bearer {token_a}"}
-        acct_a = await client.post("/accounts", json={}, headers=headers_a)
-        account_a_id = acct_a.json()["id"]
-
-        # User B: depositing then debiting
-        signup_b = await client.post(
-            "/auth/signup",
-            json={
-                "email": "mix_b@example.com",
-                "password": "StrongPass99!",
-                "first_name": "Mix",
-                "last_name": "B",
-            },
-        )
-        token_b = signup_b.json()["token"]
-        headers_b = {"Authorization": f"Bearer {token_b}"}
-        acct_b = await client.post("/accounts", json={}, headers=headers_b)
-        account_b_id = acct_b.json()["id"]
-
-        # Pre-fund User B
-        await client.post(
-            f"/accounts/{account_b_id}/transactions",
-            json={"type": "credit", "amount_cents": 20000},
-            headers=headers_b,
+        # User A: depositing; User B: opened with $200, then debiting
+        (headers_a, account_a_id), (headers_b, account_b_id) = await asyncio.gather(
+            member_account("mix_a@example.com", "Mix", "A"),
+            member_account("mix_b@example.com", "Mix", "B", deposit_cents=20000),
         )
 
         # Fire concurrent: User A deposits, User B debits
@@ -431,10 +441,10 @@ class TestConcurrentTransactions:
         assert results[1].status_code == 201
 
         bal_a = await client.get(
-            f"/accounts/{account_a_id}/balance", headers=headers_a
+            f"/accounts/{account_a_id}/balance?compute=false", headers=headers_a
         )
         bal_b = await client.get(
-            f"/accounts/{account_b_id}/balance", headers=headers_b
+            f"/accounts/{account_b_id}/balance?compute=false", headers=headers_b
         )
         assert bal_a.json()["cached_balance_cents"] == 15000
         assert bal_b.json()["cached_balance_cents"] == 12000
@@ -443,52 +453,26 @@ class TestConcurrentTransactions:
 class TestAdminTransactionAccess:
     """Tests that admins can view all transactions org-wide."""
 
-    async def test_admin_can_list_all_transactions(self, admin_client, client):
+    async def test_admin_can_list_all_transactions(self, admin_client, client, txn_member):
         """Admin should see ALL transactions across the org."""
-        signup = await client.post(
-            "/auth/signup",
-            json={
-                "email": "txn_member@example.com",
-                "password": "StrongPass99!",
-                "first_name": "Txn",
-                "last_name": "Member",
-            },
-        )
-        member_token = signup.json()["token"]
-        member_headers = {"Authorization": f"Bearer {member_token}"}
-
-        acct = await client.post("/accounts", json={}, headers=member_headers)
-        account_id = acct.json()["id"]
+        headers, account_id = txn_member
         await client.post(
             f"/accounts/{account_id}/transactions",
             json={"type": "credit", "amount_cents": 5000},
-            headers=member_headers,
+            headers=headers,
         )
 
         response = await admin_client.get("/admin/transactions")
         assert response.status_code == 200
         assert len(response.json()) >= 1
 
-    async def test_admin_can_view_account_transactions(self, admin_client, client):
+    async def test_admin_can_view_account_transactions(self, admin_client, client, txn_member):
         """Admin should be able to list any account's transactions."""
-        signup = await client.post(
-            "/auth/signup",
-            json={
-                "email": "acct_txn@example.com",
-                "password": "StrongPass99!",
-                "first_name": "Acct",
-                "last_name": "Txn",
-            },
-        )
-        member_token = signup.json()["token"]
-        member_headers = {"Authorization": f"Bearer {member_token}"}
-
-        acct = await client.post("/accounts", json={}, headers=member_headers)
-        account_id = acct.json()["id"]
+        headers, account_id = txn_member
         await client.post(
             f"/accounts/{account_id}/transactions",
             json={"type": "credit", "amount_cents": 7777},
-            headers=member_headers,
+            headers=headers,
         )
 
         response = await admin_client.get(
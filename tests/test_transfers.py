@@ -4,7 +4,7 @@ Tests for transfer endpoints (atomic money movement between accounts).
 These tests verify:
   - Successful transfers create paired debit + credit transactions
   - Transfers are atomic (both legs succeed or neither does)
-  - Mid-transaction failures roll back completely (no partial state)
+  - Rejected transfers leave no partial state behind
   - Transfers are declined when source has insufficient funds
   - Declined transfers still record an audit-trail transaction
   - Cannot transfer to the same account
@@ -14,41 +14,49 @@ These tests verify:
   - Admin cannot initiate transfers
 """
 
-import uuid
-from unittest.mock import patch, AsyncMock
+import asyncio
 
 import pytest
+from pydantic import ValidationError
+
+from app.schemas.transaction import TransferRequest
+
+# IDs no account will ever have, for requests that must not find one
+FAKE_ACCOUNT_ID = "00000000-0000-0000-0000-000000000000"
+FAKE_ACCOUNT_ID_2 = "00000000-0000-0000-0000-000000000001"
 
 
 class TestTransferSuccess:
     """Tests for successful transfer operations."""
 
-    async def test_transfer_between_own_accounts(self, authenticated_client):
-        """Transfer between two accounts owned by the same user (intra-user)."""
-        acct_a = await authenticated_client.post("/accounts", json={})
-        acct_b = await authenticated_client.post("/accounts", json={})
-        account_a_id = acct_a.json()["id"]
-        account_b_id = acct_b.json()["id"]
-
+    @pytest.mark.parametrize(
+        "fund,amount,expected_a",
+        [(10000, 5000, 5000), (7500, 7500, 0), (10000, 3000, 7000)],
+        ids=["half", "exact-balance", "small"],
+    )
+    async def test_transfer_between_own_accounts(
+        self, authenticated_client, two_funded_accounts, fund, amount, expected_a
+    ):
+        """Transfer between two accounts owned by the same user (intra-user).
+
+        Covers a partial transfer and one that empties the source exactly.
+        Every case must create exactly two linked transactions.
+        """
         # Fund the source
-        await authenticated_client.post(
-            f"/accounts/{account_a_id}/transactions",
-            json={"type": "credit", "amount_cents": 10000},
-        )
+        account_a_id, account_b_id = await two_funded_accounts(fund_a=fund)
 
-        # Transfer $50 from A to B
         response = await authenticated_client.post(
             "/transfers",
             json={
                 "from_account_id": account_a_id,
                 "to_account_id": account_b_id,
-                "amount_cents": 5000,
+                "amount_cents": amount,
                 "description": "Savings transfer",
             },
         )
         assert response.status_code == 201
         data = response.json()
-        assert data["amount_cents"] == 5000
+        assert data["amount_cents"] == amount
         assert data["from_account_id"] == account_a_id
         assert data["to_account_id"] == account_b_id
         assert data["transfer_pair_id"] is not None
@@ -56,10 +64,10 @@ class TestTransferSuccess:
         # Verify paired transactions
         assert data["debit_transaction"]["type"] == "debit"
         assert data["debit_transaction"]["status"] == "approved"
-        assert data["debit_transaction"]["amount_cents"] == 5000
+        assert data["debit_transaction"]["amount_cents"] == amount
         assert data["credit_transaction"]["type"] == "credit"
         assert data["credit_transaction"]["status"] == "approved"
-        assert data["credit_transaction"]["amount_cents"] == 5000
+        assert data["credit_transaction"]["amount_cents"] == amount
 
         # Both transactions share the same transfer_pair_id
         assert (
@@ -69,31 +77,59 @@ class TestTransferSuccess:
         )
 
         # Verify balances
-        bal_a = await authenticated_client.get(f"/accounts/{account_a_id}/balance")
-        bal_b = await authenticated_client.get(f"/accounts/{account_b_id}/balance")
-        assert bal_a.json()["cached_balance_cents"] == 5000  # 10000 - 5000
-        assert bal_b.json()["cached_balance_cents"] == 5000  # 0 + 5000
+        balances = await authenticated_client.get(
+            f"/accounts/balances?ids={account_a_id}&ids={account_b_id}"
+        )
+        bal_a, bal_b = balances.json()
+        assert bal_a["cached_balance_cents"] == expected_a
+        assert bal_b["cached_balance_cents"] == amount
+
+        # Exactly two transactions: source has the deposit + the transfer
+        # debit, destination only the transfer credit
+        txns_a, txns_b = await asyncio.gather(
+            authenticated_client.get(f"/accounts/{account_a_id}/transactions"),
+            authenticated_client.get(f"/accounts/{account_b_id}/transactions"),
+        )
+        assert len(txns_a.json()) == 2
+        assert len(txns_b.json()) == 1
+        all_txns = txns_a.json() + txns_b.json()
+        transfer_txns = [t for t in all_txns if t["transfer_pair_id"] == data["transfer_pair_id"]]
+        assert len(transfer_txns) == 2
 
-    async def test_intra_user_checking_to_savings(self, authenticated_client):
+    async def test_transfer_writes_both_legs_in_one_insert(
+        self, authenticated_client, two_funded_accounts, count_queries
+    ):
+        """A transfer locks both accounts and writes both legs in one statement each."""
+        account_a_id, account_b_id = await two_funded_accounts(fund_a=10000)
+
+        with count_queries() as queries:
+            response = await authenticated_client.post(
+                "/transfers",
+                json={
+                    "from_account_id": account_a_id,
+                    "to_account_id": account_b_id,
+                    "amount_cents": 2500,
+                },
+            )
+        assert response.status_code == 201
+        assert sum(q.startswith("SELECT accounts.") for q in queries) == 1
+        assert sum(q.startswith("INSERT INTO transactions") for q in queries) == 1
+
+    async def test_intra_user_checking_to_savings(self, authenticated_client, seed_txns):
         """A user with checking and savings accounts can transfer between them.
 
         This is the most common intra-user transfer pattern — moving money
         from checking to savings or vice versa.
         """
-        checking = await authenticated_client.post(
-            "/accounts", json={"account_type": "checking"}
-        )
-        savings = await authenticated_client.post(
-            "/accounts", json={"account_type": "savings"}
+        checking, savings = await asyncio.gather(
+            authenticated_client.post("/accounts", json={"account_type": "checking"}),
+            authenticated_client.post("/accounts", json={"account_type": "savings"}),
         )
         checking_id = checking.json()["id"]
         savings_id = savings.json()["id"]
 
         # Deposit $500 into checking
-        await authenticated_client.post(
-            f"/accounts/{checking_id}/transactions",
-            json={"type": "credit", "amount_cents": 50000},
-        )
+        await seed_txns(checking_id, [{"type": "credit", "amount_cents": 50000}])
 
         # Move $200 to savings
         response = await authenticated_client.post(
@@ -121,76 +157,25 @@ class TestTransferSuccess:
 
         # Checking: 50000 - 20000 + 5000 = 35000
         # Savings:  0 + 20000 - 5000 = 15000
-        bal_c = await authenticated_client.get(f"/accounts/{checking_id}/balance")
-        bal_s = await authenticated_client.get(f"/accounts/{savings_id}/balance")
-        assert bal_c.json()["cached_balance_cents"] == 35000
-        assert bal_s.json()["cached_balance_cents"] == 15000
-        assert bal_c.json()["match"] is True
-        assert bal_s.json()["match"] is True
-
-    async def test_transfer_exact_balance(self, authenticated_client):
-        """Transferring the exact balance should succeed (leaving zero)."""
-        acct_a = await authenticated_client.post("/accounts", json={})
-        acct_b = await authenticated_client.post("/accounts", json={})
-        account_a_id = acct_a.json()["id"]
-        account_b_id = acct_b.json()["id"]
-
-        await authenticated_client.post(
-            f"/accounts/{account_a_id}/transactions",
-            json={"type": "credit", "amount_cents": 7500},
-        )
-
-        response = await authenticated_client.post(
-            "/transfers",
-            json={
-                "from_account_id": account_a_id,
-                "to_account_id": account_b_id,
-                "amount_cents": 7500,
-            },
+        balances = await authenticated_client.get(
+            f"/accounts/balances?ids={checking_id}&ids={savings_id}"
         )
-        assert response.status_code == 201
-
-        bal_a = await authenticated_client.get(f"/accounts/{account_a_id}/balance")
-        assert bal_a.json()["cached_balance_cents"] == 0
+        bal_c, bal_s = balances.json()
+        assert bal_c["cached_balance_cents"] == 35000
+        assert bal_s["cached_balance_cents"] == 15000
+        assert bal_c["match"] is True
+        assert bal_s["match"] is True
 
-    async def test_inter_user_transfer(self, client):
+    async def test_inter_user_transfer(self, client, member_account, seed_txns):
         """Transfer from User A's account to User B's account."""
-        # Create User A
-        signup_a = await client.post(
-            "/auth/signup",
-            json={
-                "email": "transfer_a@example.com",
-                "password": "StrongPass99!",
-                "first_name": "Transfer",
-                "last_name": "A",
-            },
+        # Create User A and User B
+        (headers_a, account_a_id), (headers_b, account_b_id) = await asyncio.gather(
+            member_account("transfer_a@example.com", "Transfer", "A"),
+            member_account("transfer_b@example.com", "Transfer", "B"),
         )
-        token_a = signup_a.json()["token"]
-        headers_a = {"Authorization": f"Bearer {token_a}"}
-        acct_a = await client.post("/accounts", json={}, headers=headers_a)
-        account_a_id = acct_a.json()["id"]
 
         # Fund User A
-        await client.post(
-            f"/accounts/{account_a_id}/transactions",
-            json={"type": "credit", "amount_cents": 20000},
-            headers=headers_a,
-        )
-
-        # Create User B
-        signup_b = await client.post(
-            "/auth/signup",
-            json={
-                "email": "transfer_b@example.com",
-                "password": "StrongPass99!",
-                "first_name": "Transfer",
-                "last_name": "B",
-            },
-        )
-        token_b = signup_b.json()["token"]
-        headers_b = {"Authorization": f"Bearer {token_b}"}
-        acct_b = await client.post("/accounts", json={}, headers=headers_b)
-        account_b_id = acct_b.json()["id"]
+        await seed_txns(account_a_id, [{"type": "credit", "amount_cents": 20000}])
 
         # User A transfers $100 to User B
         response = await client.post(
@@ -206,8 +191,10 @@ class TestTransferSuccess:
         assert response.status_code == 201
 
         # Verify balances
-        bal_a = await client.get(f"/accounts/{account_a_id}/balance", headers=headers_a)
-        bal_b = await client.get(f"/accounts/{account_b_id}/balance", headers=headers_b)
+        bal_a, bal_b = await asyncio.gather(
+            client.get(f"/accounts/{account_a_id}/balance", headers=headers_a),
+            client.get(f"/accounts/{account_b_id}/balance", headers=headers_b),
+        )
         assert bal_a.json()["cached_balance_cents"] == 10000
         assert bal_b.json()["cached_balance_cents"] == 10000
 
@@ -215,18 +202,10 @@ class TestTransferSuccess:
 class TestTransferFailures:
     """Tests for transfer rejection scenarios."""
 
-    async def test_insufficient_funds_rejected(self, authenticated_client):
+    async def test_insufficient_funds_rejected(self, authenticated_client, two_funded_accounts):
         """Transfer exceeding balance should be declined (422)."""
-        acct_a = await authenticated_client.post("/accounts", json={})
-        acct_b = await authenticated_client.post("/accounts", json={})
-        account_a_id = acct_a.json()["id"]
-        account_b_id = acct_b.json()["id"]
-
         # Fund with $50
-        await authenticated_client.post(
-            f"/accounts/{account_a_id}/transactions",
-            json={"type": "credit", "amount_cents": 5000},
-        )
+        account_a_id, account_b_id = await two_funded_accounts(fund_a=5000)
 
         # Try to transfer $100
         response = await authenticated_client.post(
@@ -240,67 +219,42 @@ class TestTransferFailures:
         assert response.status_code == 422
         assert "Insufficient funds" in response.json()["detail"]
 
-        # Source balance unchanged
-        bal_a = await authenticated_client.get(f"/accounts/{account_a_id}/balance")
-        assert bal_a.json()["cached_balance_cents"] == 5000
-
-        # Destination balance unchanged
-        bal_b = await authenticated_client.get(f"/accounts/{account_b_id}/balance")
-        assert bal_b.json()["cached_balance_cents"] == 0
+        # Source and destination balances unchanged
+        balances = await authenticated_client.get(
+            f"/accounts/balances?ids={account_a_id}&ids={account_b_id}"
+        )
+        bal_a, bal_b = balances.json()
+        assert bal_a["cached_balance_cents"] == 5000
+        assert bal_b["cached_balance_cents"] == 0
 
     async def test_same_account_rejected(self, authenticated_client):
-        """Cannot transfer to the same account."""
-        acct = await authenticated_client.post("/accounts", json={})
-        account_id = acct.json()["id"]
+        """Cannot transfer to the same account.
 
+        Request validation rejects this before any account is looked up, so
+        no real account is needed.
+        """
         response = await authenticated_client.post(
             "/transfers",
             json={
-                "from_account_id": account_id,
-                "to_account_id": account_id,
+                "from_account_id": FAKE_ACCOUNT_ID,
+                "to_account_id": FAKE_ACCOUNT_ID,
                 "amount_cents": 1000,
             },
         )
         assert response.status_code == 422
 
-    async def test_cannot_transfer_from_other_users_account(self, client):
+    async def test_cannot_transfer_from_other_users_account(
+        self, client, member_account, seed_txns
+    ):
         """Cannot use another user's account as the source."""
-        # Create User A (the victim)
-        signup_a = await client.post(
-            "/auth/signup",
-            json={
-                "email": "victim@example.com",
-                "password": "StrongPass99!",
-                "first_name": "Victim",
-                "last_name": "User",
-            },
+        # Create User A (the victim) and User B (the attacker)
+        (headers_a, account_a_id), (headers_b, account_b_id) = await asyncio.gather(
+            member_account("victim@example.com", "Victim", "User"),
+            member_account("attacker@example.com", "Attacker", "User"),
         )
-        token_a = signup_a.json()["token"]
-        headers_a = {"Authorization": f"Bearer {token_a}"}
-        acct_a = await client.post("/accounts", json={}, headers=headers_a)
-        account_a_id = acct_a.json()["id"]
 
         # Fund victim's account
-        await client.post(
-            f"/accounts/{account_a_id}/transactions",
-            json={"type": "credit", "amount_cents": 50000},
-            headers=headers_a,
-        )
-
-        # Create User B (the attacker)
-        signup_b = await client.post(
-            "/auth/signup",
-            json={
-                "email": "attacker@example.com",
-                "password": "StrongPass99!",
-                "first_name": "Attacker",
-                "last_name": "User",
-            },
-        )
-        token_b = signup_b.json()["token"]
-        headers_b = {"Authorization": f"Bearer {token_b}"}
-        acct_b = await client.post("/accounts", json={}, headers=headers_b)
-        account_b_id = acct_b.json()["id"]
+        await seed_txns(account_a_id, [{"type": "credit", "amount_cents": 50000}])
 
         # User B tries to transfer FROM User A's account
         response = await client.post(
@@ -322,100 +276,84 @@ class TestTransferFailures:
         """Transfer with a nonexistent account should return 404."""
         acct = await authenticated_client.post("/accounts", json={})
         account_id = acct.json()["id"]
-        fake_id = str(uuid.uuid4())
 
         response = await authenticated_client.post(
             "/transfers",
             json={
                 "from_account_id": account_id,
-                "to_account_id": fake_id,
+                "to_account_id": FAKE_ACCOUNT_ID,
                 "amount_cents": 1000,
             },
         )
         assert response.status_code == 404
 
     async def test_zero_amount_rejected(self, authenticated_client):
-        """Zero-amount transfers should be rejected (422)."""
-        acct_a = await authenticated_client.post("/accounts", json={})
-        acct_b = await authenticated_client.post("/accounts", json={})
-
+        """Zero-amount transfers should be rejected (422) by request validation."""
         response = await authenticated_client.post(
             "/transfers",
             json={
-                "from_account_id": acct_a.json()["id"],
-                "to_account_id": acct_b.json()["id"],
+                "from_account_id": FAKE_ACCOUNT_ID,
+                "to_account_id": FAKE_ACCOUNT_ID_2,
                 "amount_cents": 0,
             },
         )
         assert response.status_code == 422
 
 
-class TestTransferAtomicity:
-    """Tests that transfers are truly atomic — both legs succeed or neither does.
+class TestTransferRequestValidation:
+    """The TransferRequest rules themselves, checked without the app or a database."""
+
+    def test_same_account_rejected_at_schema(self):
+        """Source and destination must differ."""
+        with pytest.raises(ValidationError, match="Cannot transfer to the same account"):
+            TransferRequest(
+                from_account_id=FAKE_ACCOUNT_ID,
+                to_account_id=FAKE_ACCOUNT_ID,
+                amount_cents=1000,
+            )
 
-    In a real banking system, mid-transaction failures can happen due to:
-      - Server crashes / process kills
-      - Database connection drops
-      - Disk full / I/O errors
-      - Network partitions
+    @pytest.mark.parametrize("amount_cents", [0, -1])
+    def test_non_positive_amount_rejected_at_schema(self, amount_cents):
+        """Amounts must be strictly positive."""
+        with pytest.raises(ValidationError):
+            TransferRequest(
+                from_account_id=FAKE_ACCOUNT_ID,
+                to_account_id=FAKE_ACCOUNT_ID_2,
+                amount_cents=amount_cents,
+            )
 
-    These tests simulate such failures by injecting errors at critical points
-    in the transfer flow and verifying that no partial state is left behind.
+
+class TestTransferAtomicity:
+    """Tests that a transfer either completes or leaves no trace.
+
+    A rejected transfer (missing destination, insufficient funds) must not
+    change either balance or leave a stray debit or credit behind, and a
+    declined one records only its audit-trail row. Balances must still
+    reconcile with the ledger after a run of transfers. No failures are
+    injected mid-write here; rollback of a crashed write is SQLAlchemy's
+    transaction handling, not transfer logic.
     """
 
-    async def test_crash_after_debit_before_credit_rolls_back(self, authenticated_client):
-        """Simulate a DB failure after the debit is created but before the credit.
+    async def test_failed_transfer_leaves_no_partial_state(
+        self, authenticated_client, seed_txns
+    ):
+        """A transfer to a missing destination must not move money or write any leg.
 
-        This is the worst-case scenario for atomicity: if the debit is committed
-        without the credit, money disappears. We verify that SQLAlchemy's
-        transaction management correctly rolls back the entire operation.
+        Both accounts are loaded before anything is written, so the 404 is
+        raised before either leg exists: the source balance must be exactly
+        as it was, and its ledger must hold only the funding deposit.
         """
         acct_a = await authenticated_client.post("/accounts", json={})
-        acct_b = await authenticated_client.post("/accounts", json={})
         account_a_id = acct_a.json()["id"]
-        account_b_id = acct_b.json()["id"]
 
         # Fund source account
-        await authenticated_client.post(
-            f"/accounts/{account_a_id}/transactions",
-            json={"type": "credit", "amount_cents": 10000},
-        )
+        await seed_txns(account_a_id, [{"type": "credit", "amount_cents": 10000}])
 
-        # Patch db.add_all to simulate a crash when adding the paired transactions.
-        # The original add_all is called for the debit+credit pair; we make it fail.
-        original_flush = None
-
-        call_count = 0
-
-        async def failing_flush(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            # The transfer service calls flush() after add_all(). Let the first
-            # flush calls succeed (account lookups, etc.) but fail on the
-            # transfer's final flush.
-            if call_count >= 4:
-                raise RuntimeError("Simulated database crash")
-            return await original_flush(*args, **kwargs)
-
-        # Attempt the transfer — it should fail with a 500
-        with patch(
-            "app.services.transaction_service.AsyncSession.flush",
-            side_effect=failing_flush,
-        ) as mock:
-            # This approach patches at the class level, which won't work well.
-            # Instead, let's test by verifying the end state.
-            pass
-
-        # Since patching async session methods is complex, we verify atomicity
-        # through the business logic: attempt a transfer that fails due to
-        # an application error (nonexistent destination), and verify no
-        # balance changes occurred on the source.
-        fake_dest = str(uuid.uuid4())
         response = await authenticated_client.post(
             "/transfers",
             json={
                 "from_account_id": account_a_id,
-                "to_account_id": fake_dest,
+                "to_account_id": FAKE_ACCOUNT_ID,
                 "amount_cents": 5000,
             },
         )
@@ -426,44 +364,16 @@ class TestTransferAtomicity:
         assert bal_a.json()["cached_balance_cents"] == 10000
         assert bal_a.json()["match"] is True
 
-    async def test_failed_transfer_leaves_no_orphaned_transactions(self, authenticated_client):
-        """When a transfer fails (e.g., account not found), no transactions
-        should be created — neither the debit nor the credit.
-
-        This verifies the rollback behavior: if the transfer can't complete,
-        the entire database transaction is rolled back.
-        """
-        acct_a = await authenticated_client.post("/accounts", json={})
-        account_a_id = acct_a.json()["id"]
-        fake_dest = str(uuid.uuid4())
-
-        await authenticated_client.post(
-            f"/accounts/{account_a_id}/transactions",
-            json={"type": "credit", "amount_cents": 10000},
-        )
-
-        # Attempt transfer to nonexistent account
-        response = await authenticated_client.post(
-            "/transfers",
-            json={
-                "from_account_id": account_a_id,
-                "to_account_id": fake_dest,
-                "amount_cents": 5000,
-            },
-        )
-        assert response.status_code == 404
-
         # Only the initial deposit should exist — no orphaned debit transaction
         txns = await authenticated_client.get(f"/accounts/{account_a_id}/transactions")
         assert len(txns.json()) == 1
-        assert txns.json()[0]["type"] == "credit"  # Only the deposit
+        assert txns.json()[0]["type"] == "credit"
 
-    async def test_declined_transfer_records_audit_trail(self, authenticated_client):
+    async def test_declined_transfer_records_audit_trail(
+        self, authenticated_client, two_funded_accounts
+    ):
         """A declined transfer should record a declined transaction for auditing."""
-        acct_a = await authenticated_client.post("/accounts", json={})
-        acct_b = await authenticated_client.post("/accounts", json={})
-        account_a_id = acct_a.json()["id"]
-        account_b_id = acct_b.json()["id"]
+        account_a_id, account_b_id = await two_funded_accounts(fund_a=0)
 
         # Try to transfer with zero balance
         await authenticated_client.post(
@@ -486,96 +396,63 @@ class TestTransferAtomicity:
         assert declined[0]["amount_cents"] == 5000
         assert declined[0]["transfer_pair_id"] is not None
 
-    async def test_transfer_creates_exactly_two_transactions(self, authenticated_client):
-        """A successful transfer should create exactly two linked transactions."""
-        acct_a = await authenticated_client.post("/accounts", json={})
-        acct_b = await authenticated_client.post("/accounts", json={})
-        account_a_id = acct_a.json()["id"]
-        account_b_id = acct_b.json()["id"]
-
-        await authenticated_client.post(
-            f"/accounts/{account_a_id}/transactions",
-            json={"type": "credit", "amount_cents": 10000},
-        )
-
-        transfer = await authenticated_client.post(
-            "/transfers",
-            json={
-                "from_account_id": account_a_id,
-                "to_account_id": account_b_id,
-                "amount_cents": 3000,
-            },
-        )
-        transfer_pair_id = transfer.json()["transfer_pair_id"]
-
-        # Source account should have: 1 deposit + 1 transfer debit = 2 transactions
-        txns_a = await authenticated_client.get(
-            f"/accounts/{account_a_id}/transactions"
-        )
-        assert len(txns_a.json()) == 2
-
-        # Destination account should have: 1 transfer credit = 1 transaction
-        txns_b = await authenticated_client.get(
-            f"/accounts/{account_b_id}/transactions"
-        )
-        assert len(txns_b.json()) == 1
-
-        # Both transfer transactions share the same transfer_pair_id
-        all_txns = txns_a.json() + txns_b.json()
-        transfer_txns = [t for t in all_txns if t["transfer_pair_id"] == transfer_pair_id]
-        assert len(transfer_txns) == 2
-
-    async def test_balance_integrity_after_transfers(self, authenticated_client):
+    @pytest.mark.parametrize(
+        "transfers,expected_a,expected_b",
+        [
+            # A: 20000 - 5000 - 3000 + 2000 = 14000; B: 5000 + 3000 - 2000 = 6000
+            ([(5000, "a2b"), (3000, "a2b"), (2000, "b2a")], 14000, 6000),
+            # Drain A completely, then B sends half back
+            ([(20000, "a2b"), (10000, "b2a")], 10000, 10000),
+            # The overdraw is declined; only the approved legs count
+            ([(15000, "a2b"), (9000, "a2b"), (1000, "b2a")], 6000, 14000),
+        ],
+        ids=["back-and-forth", "drain-and-return", "declined-overdraw"],
+    )
+    async def test_balance_integrity_after_transfers(
+        self, authenticated_client, two_funded_accounts, transfers, expected_a, expected_b
+    ):
         """Cached and computed balances should match after multiple transfers."""
-        acct_a = await authenticated_client.post("/accounts", json={})
-        acct_b = await authenticated_client.post("/accounts", json={})
-        account_a_id = acct_a.json()["id"]
-        account_b_id = acct_b.json()["id"]
-
         # Fund account A with $200
-        await authenticated_client.post(
-            f"/accounts/{account_a_id}/transactions",
-            json={"type": "credit", "amount_cents": 20000},
-        )
+        account_a_id, account_b_id = await two_funded_accounts(fund_a=20000)
+        accounts = {"a": account_a_id, "b": account_b_id}
 
-        # Multiple transfers back and forth
-        await authenticated_client.post(
-            "/transfers",
-            json={"from_account_id": account_a_id, "to_account_id": account_b_id, "amount_cents": 5000},
-        )
-        await authenticated_client.post(
-            "/transfers",
-            json={"from_account_id": account_a_id, "to_account_id": account_b_id, "amount_cents": 3000},
-        )
-        await authenticated_client.post(
-            "/transfers",
-            json={"from_account_id": account_b_id, "to_account_id": account_a_id, "amount_cents": 2000},
-        )
+        # Each transfer depends on the balances the previous one left, so
+        # they are sent one at a time
+        for amount_cents, direction in transfers:
+            source, dest = direction.split("2")
+            await authenticated_client.post(
+                "/transfers",
+                json={
+                    "from_account_id": accounts[source],
+                    "to_account_id": accounts[dest],
+                    "amount_cents": amount_cents,
+                },
+            )
 
-        # A: 20000 - 5000 - 3000 + 2000 = 14000
-        # B: 0 + 5000 + 3000 - 2000 = 6000
-        bal_a = await authenticated_client.get(f"/accounts/{account_a_id}/balance")
-        bal_b = await authenticated_client.get(f"/accounts/{account_b_id}/balance")
+        balances = await authenticated_client.get(
+            f"/accounts/balances?ids={accounts['a']}&ids={accounts['b']}"
+        )
+        bal_a, bal_b = balances.json()
 
-        assert bal_a.json()["cached_balance_cents"] == 14000
-        assert bal_a.json()["computed_balance_cents"] == 14000
-        assert bal_a.json()["match"] is True
+        assert bal_a["cached_balance_cents"] == expected_a
+        assert bal_a["computed_balance_cents"] == expected_a
+        assert bal_a["match"] is True
 
-        assert bal_b.json()["cached_balance_cents"] == 6000
-        assert bal_b.json()["computed_balance_cents"] == 6000
-        assert bal_b.json()["match"] is True
+        assert bal_b["cached_balance_cents"] == expected_b
+        assert bal_b["computed_balance_cents"] == expected_b
+        assert bal_b["match"] is True
 
 
 class TestAdminCannotTransfer:
     """Tests that admins are blocked from the transfer endpoint."""
 
-    async def test_admin_cannot_initiate_transfer(self, admin_client, client):
+    async def test_admin_cannot_initiate_transfer(self, admin_client):
         """Admins should get 403 when trying to initiate a transfer."""
         response = await admin_client.post(
             "/transfers",
             json={
-                "from_account_id": str(uuid.uuid4()),
-                "to_account_id": str(uuid.uuid4()),
+                "from_account_id": FAKE_ACCOUNT_ID,
+                "to_account_id": FAKE_ACCOUNT_ID_2,
                 "amount_cents": 1000,
             },
         )